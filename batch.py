@@ -0,0 +1,66 @@
+# Generate many projects at once from a JSON or CSV manifest
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+import argparse, sys
+from template_generator.batch import load_manifest, generate_batch, plan_batch, write_summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate every project listed in a manifest of "
+                    "(template, project_name, author, root_dir) rows."
+    )
+    parser.add_argument("manifest", help="a `.json` or `.csv` manifest")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="number of worker processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "-s", "--summary", default=None,
+        help="write the per-row results to this `.json` or `.csv` file"
+    )
+    parser.add_argument(
+        "--plan", action="store_true",
+        help="only print the files, inodes and bytes the projects would take"
+    )
+    args = parser.parse_args()
+
+    try:
+        rows = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    if args.plan:
+        totals = plan_batch(rows)
+        print(
+            f"{totals['projects']} project(s): {totals['files']} files, "
+            f"{totals['directories']} directories ({totals['inodes']} inodes), "
+            f"{totals['bytes']} bytes"
+        )
+        if totals["venv_unknown"]:
+            print(f"({totals['venv_unknown']} virtualenv(s) not included: no venv seed to estimate them from yet)")
+        for num, error in totals["errors"]:
+            print(f"{num:>4}. FAILED ({error})")
+        sys.exit(1 if totals["errors"] else 0)
+
+    results = generate_batch(rows, workers=args.workers)
+
+    for res in results:
+        status = "ok" if res["status"] == "ok" else f"FAILED ({res['error']})"
+        print(f"{res['row']:>4}. {res['template']:<10} {res['project_name']:<30} {status}")
+
+    failed = sum(res["status"] != "ok" for res in results)
+    print(f"\n{len(results) - failed} of {len(results)} project(s) created.")
+
+    if args.summary:
+        write_summary(results, args.summary)
+        print(f"Summary written to `{args.summary}`.")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# Import-time regression check for `template_generator`
+#
+# Runs `python -X importtime` on a fresh interpreter a few times and fails
+# (exit code 1) if importing the package
+#   - pulls in a module that is supposed to load lazily (template bodies,
+#     `terminal_style`, the tree store and index modules, the timings,
+#     plans and registry of `ProjectTemplate`), also through
+#     `from template_generator import *`, or
+#   - takes longer than the budget (best of the runs).
+#
+# Usage: python3 benchmarks/bench_import.py [budget_ms]
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import subprocess, sys
+from common import REPO_ROOT, python_env
+
+DEFAULT_BUDGET_MS = 60
+RUNS = 5
+
+STATEMENT = "import template_generator"
+
+# Must not import `LAZY_MODULES` either, so `__all__` lists no lazy name.
+STAR_STATEMENT = "from template_generator import *"
+
+# Modules that must not be imported by `STATEMENT` or `STAR_STATEMENT`.
+LAZY_MODULES = (
+    "template_generator.terminal_style",
+    "template_generator.tree_index",
+    "template_generator.tree_store",
+    "template_generator.blob_store",
+    "template_generator.snapshot",
+    "template_generator.timings",
+    "template_generator.plan",
+    "template_generator.registry",
+    "template_generator.templates.common",
+    "template_generator.templates.pyscript",
+    "template_generator.templates.pyproject",
+    "template_generator.templates.flaskapp",
+)
+
+
+def importtime(statement:str):
+    """
+    Run `statement` under `-X importtime` in a fresh interpreter.
+
+    :return: A dict mapping each imported module to its cumulative import
+             time in microseconds.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT, env=python_env(), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        text=True, check=True
+    ).stderr
+
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def imported(statement:str):
+    """
+    Names of the modules loaded after running `statement` in a fresh
+    interpreter. Unlike `importtime`, this sees the modules loaded through
+    `importlib.import_module`, as the lazy names are.
+    """
+    stdout = subprocess.run(
+        [sys.executable, "-c", statement + "\nimport sys\nprint(*sys.modules, sep='\\n')"],
+        cwd=REPO_ROOT, env=python_env(), stdout=subprocess.PIPE, text=True, check=True
+    ).stdout
+    return set(stdout.split())
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+
+    importtime(STATEMENT) # Warm up the byte code cache
+    runs = [importtime(STATEMENT) for _ in range(RUNS)]
+    best_ms = min(run["template_generator"] for run in runs) / 1000
+
+    print(f"`{STATEMENT}`: {best_ms:.1f} ms (best of {RUNS}, budget {budget_ms:g} ms)")
+    failed = False
+    for statement in (STATEMENT, STAR_STATEMENT):
+        modules = imported(statement)
+        eager = [name for name in LAZY_MODULES if name in modules]
+        if eager:
+            print(f"FAIL: `{statement}` imported eagerly: " + ", ".join(eager))
+            failed = True
+    if best_ms > budget_ms:
+        print("FAIL: over the import-time budget")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
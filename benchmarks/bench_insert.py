@@ -0,0 +1,63 @@
+# Benchmark: building a large `Directory` programmatically
+#
+# Builds the same tree of `width` files in every directory of a `depth`
+# levels deep, `width` wide hierarchy twice: with `Directory.bulk_insert`
+# on full paths, and by walking `_content` dicts from the root for every
+# file (what the path API replaces).
+#
+# Usage: python3 benchmarks/bench_insert.py [width] [depth]
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import itertools, sys
+from common import best_of
+from template_generator import Directory
+
+
+def paths(width:int, depth:int):
+    """Every file path of the tree, e.g. `d0/d3/d1/f2.txt`."""
+    dirs = [f"d{i}" for i in range(width)]
+    files = [f"f{i}.txt" for i in range(width)]
+    for level in range(1, depth + 1):
+        for parents in itertools.product(dirs, repeat=level):
+            prefix = "/".join(parents)
+            for name in files:
+                yield f"{prefix}/{name}"
+
+
+def build_walking(file_paths):
+    root = Directory("root")
+    for path in file_paths:
+        *parents, name = path.split("/")
+        directory = root
+        for part in parents:
+            if part not in directory._content:
+                directory.add_directory(part)
+            directory = directory._content[part]
+        directory.add_file(name, content="")
+    return root
+
+
+def build_bulk_insert(file_paths):
+    root = Directory("root")
+    root.bulk_insert((path, "") for path in file_paths)
+    return root
+
+
+def main():
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    file_paths = list(paths(width, depth))
+
+    assert build_walking(file_paths).tree == build_bulk_insert(file_paths).tree
+
+    print(f"{len(file_paths)} files, {depth} levels deep:")
+    for label, build in [("walking _content", build_walking), ("bulk_insert", build_bulk_insert)]:
+        seconds = best_of(lambda: build(file_paths), repeat=3)
+        print(f"  {label:<18} {seconds * 1000:8.1f} ms  {seconds / len(file_paths) * 1e6:6.2f} us per insert")
+
+
+if __name__ == '__main__':
+    main()
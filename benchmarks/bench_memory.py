@@ -0,0 +1,54 @@
+# Benchmark: memory held per node by a `Directory` snapshot
+#
+# Snapshots a synthetic tree with `Directory.instantiate_dir_from_path`
+# and with the array-backed `TreeStore.from_path` (lazily, so that only
+# the nodes are measured and not the file contents, and also in memory)
+# and reports the memory each snapshot holds per file/directory, as
+# measured by `tracemalloc`.
+#
+# Usage: python3 benchmarks/bench_memory.py [width] [depth]
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import gc, sys, tempfile, tracemalloc
+from pathlib import Path
+from common import make_synthetic_tree
+from template_generator import Directory, TreeStore
+
+
+def snapshot_size(build, root:Path, **kwargs):
+    """Bytes still allocated by the snapshot `build(root, **kwargs)` once it is built."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    snapshot = build(root, **kwargs)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del snapshot
+    return size
+
+
+def main():
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "tree"
+        entries = make_synthetic_tree(root, width, depth, file_size=16)
+
+        print(f"Snapshot of {entries} entries (width {width}, depth {depth}):")
+        for label, build, kwargs in [
+            ("Directory, lazy", Directory.instantiate_dir_from_path, {"lazy": True}),
+            ("Directory, in memory", Directory.instantiate_dir_from_path, {}),
+            ("TreeStore, lazy", TreeStore.from_path, {"lazy": True}),
+            ("TreeStore, in memory", TreeStore.from_path, {"lazy": False}),
+        ]:
+            size = snapshot_size(build, root, **kwargs)
+            print(f"  {label:<22} {size / 1024:9.1f} KiB   {size / entries:7.1f} bytes per node")
+
+
+if __name__ == '__main__':
+    main()
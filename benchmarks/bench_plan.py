@@ -0,0 +1,62 @@
+# Benchmark: generating projects from compiled template plans
+#
+# For every template, times compiling its spec, then generating `projects`
+# copies of it into a temp dir two ways: building the `Directory` object
+# graph and creating it (`plan.build(...).create(...)`, what every project
+# used to cost), and executing the cached plan (`plan.execute(...)`).
+#
+# Usage: python3 benchmarks/bench_plan.py [projects]
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import shutil, sys, tempfile, time
+from importlib import import_module
+from pathlib import Path
+from common import best_of
+from template_generator.registry import BUILTIN_TEMPLATES, get_plan
+from template_generator.spec import compile_spec
+
+
+def main():
+    projects = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print(f"{projects} projects per template")
+    for name, module in BUILTIN_TEMPLATES.items():
+        spec = import_module(module).SPEC
+        start = time.perf_counter()
+        compile_spec(spec)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        plan = get_plan(name)
+        tmp = Path(tempfile.mkdtemp(prefix="bench_plan_"))
+        runs = iter(range(10 ** 9))
+
+        def variables(i):
+            return plan.variables(project=f"project {i}", author="Indrajit Ghosh", date="Oct 18, 2026")
+
+        def tree():
+            base = tmp / f"run_{next(runs)}"
+            base.mkdir()
+            for i in range(projects):
+                plan.build(variables(i)).create(base)
+
+        def execute():
+            base = tmp / f"run_{next(runs)}"
+            base.mkdir()
+            for i in range(projects):
+                plan.execute(base, variables(i))
+
+        try:
+            results = [(label, best_of(func)) for label, func in (("tree", tree), ("plan", execute))]
+        finally:
+            shutil.rmtree(tmp)
+
+        print(f"{name} (compile {compile_ms:.2f} ms)")
+        for label, seconds in results:
+            print(f"  {label:<5} {seconds * 1000:8.1f} ms  {projects / seconds:10,.0f} projects/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# Benchmark: listing the templates with many plugins installed
+#
+# Installs `count` plugin templates into a temp dir, half as modules in a
+# plugin dir (`TEMPLATE_GENERATOR_PLUGINS`) and half as the entry points of
+# a package on `PYTHONPATH`, then times fresh interpreters listing the
+# templates, as the `main.py` menu does, with and without them. Fails (exit
+# code 1) if listing imports any plugin module, or if the plugins add more
+# than the budget.
+#
+# Usage: python3 benchmarks/bench_registry.py [count] [budget_ms]
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import os, subprocess, sys, tempfile, time
+from pathlib import Path
+from common import REPO_ROOT, python_env
+
+DEFAULT_BUDGET_MS = 10
+RUNS = 10
+
+PLUGIN_MODULE = '''import sys
+sys.modules["template_generator"].PLUGINS_IMPORTED = True
+SPEC = {"name": "%(name)s", "root": "%%(project)s", "entries": [["README.md", "# %(name)s"]]}
+'''
+
+LIST_TEMPLATES = '''import sys, template_generator
+from template_generator.registry import template_names
+names = template_names()
+assert len(names) == int(sys.argv[1]), names
+assert not getattr(template_generator, "PLUGINS_IMPORTED", False), "a plugin was imported"
+'''
+
+
+def make_plugins(root:Path, count:int):
+    """Write `count` plugin templates under `root`; return the env that finds them."""
+    plugin_dir = root / "plugins"
+    site = root / "site"
+    package = site / "bench_plugins"
+    meta = site / "bench_plugins-1.0.dist-info"
+    for d in (plugin_dir, package, meta):
+        d.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+
+    lines = ["[template_generator.templates]"]
+    for i in range(count):
+        name = f"plugin_{i}"
+        if i % 2:
+            (plugin_dir / f"{name}.py").write_text(PLUGIN_MODULE % {"name": name})
+        else:
+            (package / f"{name}.py").write_text(PLUGIN_MODULE % {"name": name})
+            lines.append(f"{name} = bench_plugins.{name}")
+    (meta / "entry_points.txt").write_text("\n".join(lines) + "\n")
+
+    env = python_env()
+    env["TEMPLATE_GENERATOR_PLUGINS"] = str(plugin_dir)
+    env["PYTHONPATH"] = os.pathsep.join([str(REPO_ROOT), str(site)])
+    return env
+
+
+def best_run(env, expected:int):
+    """Best wall time, in ms, of `RUNS` fresh interpreters listing the templates."""
+    best = float("inf")
+    for _ in range(RUNS + 1): # The first run warms up the byte code cache
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", LIST_TEMPLATES, str(expected)], env=env, check=True
+        )
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BUDGET_MS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bare = python_env()
+        bare["PYTHONPATH"] = str(REPO_ROOT)
+        bare["TEMPLATE_GENERATOR_PLUGINS"] = str(Path(tmp) / "none")
+        builtin_ms = best_run(bare, 3)
+        plugins_ms = best_run(make_plugins(Path(tmp), count), 3 + count)
+
+    overhead = plugins_ms - builtin_ms
+    status = "ok" if overhead <= budget_ms else "FAIL"
+    print(f"list the templates, built in only:    {builtin_ms:7.1f} ms (best of {RUNS})")
+    print(f"list the templates, {count:>3} plugins too: {plugins_ms:7.1f} ms  (+{overhead:.1f} ms, budget +{budget_ms:g} ms)  {status}")
+    sys.exit(0 if status == "ok" else 1)
+
+
+if __name__ == '__main__':
+    main()
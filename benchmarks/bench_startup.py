@@ -0,0 +1,81 @@
+# Cold-start budget check for the command line entry points
+#
+# Times fresh runs of `main.py` (creating a `pyscript`) and of
+# `directory_tree.py` (on a small tree) against a bare `python -c pass`,
+# and fails (exit code 1) if either adds more than the budget on top of
+# the interpreter's own startup (best of the runs, which take turns).
+#
+# Measured on the development VM (best of 10, 5 invocations): `main.py
+# pyscript` adds +30 to +34 ms and `directory_tree.py` +32 to +39 ms; the
+# same VM swings a single invocation by up to +20 ms, hence the 60 ms budget
+# (about 1.5x the worst of these) rather than a tight one.
+#
+# Usage: python3 benchmarks/bench_startup.py [budget_ms]
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import subprocess, sys, tempfile, time
+from pathlib import Path
+from common import REPO_ROOT, make_synthetic_tree, python_env
+
+DEFAULT_BUDGET_MS = 60
+RUNS = 10
+
+
+def run_ms(args, cwd, stdin=None):
+    """Wall time, in ms, of one run of `python args...`."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *args], cwd=cwd, env=python_env(), input=stdin, text=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    for script in Path(cwd).glob("bench_script*.py"):
+        script.unlink()
+    return elapsed
+
+
+def best_runs(commands, cwd):
+    """
+    Best wall time, in ms, of `RUNS` runs of each of `commands` (label ->
+    `(args, stdin)`). The commands take turns, so that a slow spell of the
+    machine hits all of them alike rather than just the one running then.
+    """
+    best = dict.fromkeys(commands, float("inf"))
+    for run in range(RUNS + 1): # The first round warms up the byte code cache
+        for label, (args, stdin) in commands.items():
+            ms = run_ms(args, cwd, stdin)
+            if run:
+                best[label] = min(best[label], ms)
+    return best
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = Path(tmp) / "tree"
+        make_synthetic_tree(tree, width=3, depth=3)
+
+        entry_points = best_runs({
+            "python -c pass": (["-c", "pass"], None),
+            "main.py pyscript": ([str(REPO_ROOT / "main.py"), "pyscript"], "bench_script\n\n"),
+            "directory_tree.py": ([str(REPO_ROOT / "directory_tree.py"), str(tree), "--no-clipboard"], None),
+        }, tmp)
+        baseline = entry_points.pop("python -c pass")
+
+    print(f"python -c pass: {baseline:.1f} ms (best of {RUNS})")
+    failed = False
+    for label, ms in entry_points.items():
+        overhead = ms - baseline
+        status = "ok" if overhead <= budget_ms else "FAIL"
+        failed |= status == "FAIL"
+        print(f"  {label:<20} {ms:7.1f} ms  (+{overhead:.1f} ms, budget +{budget_ms:g} ms)  {status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+# End-to-end benchmark suite for `ProjectTemplate` and `Directory`
+#
+# Times `ProjectTemplate.create_project` for every template (with and
+# without the virtualenv) and `Directory.create`,
+# `Directory.instantiate_dir_from_path` and `Directory.get_tree_from_path`
+# on a synthetic tree, then writes the results as JSON so that runs from
+# different commits can be compared. Everything runs offline.
+#
+# Usage: python3 benchmarks/bench_suite.py [-w WIDTH] [-d DEPTH] [-r REPEAT]
+#                                          [-o OUTPUT] [-c BASELINE]
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import argparse, io, json, platform, shutil, subprocess, sys, tempfile, time
+from contextlib import redirect_stdout
+from pathlib import Path
+from common import REPO_ROOT, make_synthetic_tree
+from template_generator import Directory, ProjectTemplate
+
+
+def timed(func, repeat:int, setup=None):
+    """
+    Run `func` `repeat` times (calling `setup` before each run, untimed)
+    and return the timings in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(name:str, timings:list, **extra):
+    return {
+        "name": name,
+        "runs": len(timings),
+        "best": min(timings),
+        "mean": sum(timings) / len(timings),
+        "max": max(timings),
+        **extra
+    }
+
+
+def git_commit():
+    """The commit the benchmarks ran against, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_templates(tmp:Path, repeat:int, with_venv:bool):
+    results = []
+    venv_modes = (False, True) if with_venv else (False,)
+    for template in ProjectTemplate.TEMPLATES:
+        for create_venv in venv_modes:
+            if create_venv and template == 'pyscript':
+                continue # A pyscript has no virtualenv
+            root = tmp / "projects"
+
+            def reset():
+                shutil.rmtree(root, ignore_errors=True)
+                root.mkdir()
+
+            def create():
+                with redirect_stdout(io.StringIO()):
+                    ProjectTemplate(
+                        project_name="bench project",
+                        template=template,
+                        root_dir=root,
+                        create_venv=create_venv
+                    ).create_project()
+
+            if create_venv:
+                reset(); create() # Build the venv seed outside the timings
+            name = f"create_project[{template}" + (",venv]" if create_venv else "]")
+            results.append(summarize(name, timed(create, repeat, setup=reset)))
+    return results
+
+
+def bench_directory(tmp:Path, repeat:int, width:int, depth:int):
+    source = tmp / "tree"
+    entries = make_synthetic_tree(source, width, depth)
+    tree = Directory.instantiate_dir_from_path(source)
+    target = tmp / "out"
+
+    def reset():
+        shutil.rmtree(target, ignore_errors=True)
+        target.mkdir()
+
+    shape = {"width": width, "depth": depth, "entries": entries}
+    return [
+        summarize(
+            "Directory.instantiate_dir_from_path",
+            timed(lambda: Directory.instantiate_dir_from_path(source), repeat),
+            **shape
+        ),
+        summarize(
+            "Directory.create",
+            timed(lambda: tree.create(target), repeat, setup=reset),
+            **shape
+        ),
+        summarize(
+            "Directory.get_tree_from_path",
+            timed(lambda: list(Directory.get_tree_from_path(source)), repeat),
+            **shape
+        ),
+    ]
+
+
+def compare(results:list, baseline_path:Path):
+    """Print each result's best time relative to the same one in `baseline_path`."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    before = {result["name"]: result["best"] for result in baseline["results"]}
+    print(f"\nCompared with {baseline_path} (commit {baseline.get('commit')}):", file=sys.stderr)
+    for result in results:
+        if result["name"] in before:
+            ratio = result["best"] / before[result["name"]]
+            print(f"{result['name']:<40} {ratio:6.2f}x", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the end-to-end benchmarks.")
+    parser.add_argument("-w", "--width", type=int, default=6, help="Files and sub directories per directory")
+    parser.add_argument("-d", "--depth", type=int, default=4, help="Levels of the synthetic tree")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Runs per benchmark")
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file (default: stdout)")
+    parser.add_argument("-c", "--compare", metavar="BASELINE", help="JSON output of an earlier run to compare against")
+    parser.add_argument("--no-venv", action="store_true", help="Skip the benchmarks that create virtualenvs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        results = bench_templates(tmp, args.repeat, with_venv=not args.no_venv)
+        results += bench_directory(tmp, args.repeat, args.width, args.depth)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results
+    }
+
+    for result in results:
+        print(f"{result['name']:<40} best {result['best'] * 1000:9.2f} ms", file=sys.stderr)
+
+    if args.compare:
+        compare(results, args.compare)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# Benchmark: `Directory.get_tree_from_path` on a synthetic tree
+#
+# Compares the `os.scandir` based traversal against the old
+# `Path.iterdir()` + `is_file()`/`is_dir()` one, both in wall time and in
+# the number of `stat` calls made.
+#
+# Usage: python3 benchmarks/bench_tree.py [width] [depth]
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import os, sys, tempfile
+from pathlib import Path
+from common import make_synthetic_tree, best_of
+from template_generator import Directory
+
+
+def iterdir_tree(dir_path: Path, prefix: str=''):
+    """The `Path.iterdir()` based traversal, kept here as the reference."""
+    space, branch, tee, last = '    ', '│   ', '├── ', '└── '
+    contents = list(dir_path.iterdir())
+    pointers = [tee] * (len(contents) - 1) + [last]
+    for pointer, path in zip(pointers, contents):
+        if path.name in Directory.IGNORE:
+            continue
+        yield prefix + pointer + Directory._colored_entry(
+            entry_name=path.name,
+            entry_type='File' if path.is_file() else 'Directory'
+        )
+        if path.is_dir():
+            extension = branch if pointer == tee else space
+            yield from iterdir_tree(path, prefix=prefix+extension)
+
+
+def count_stat_calls(func):
+    """Run `func` while counting the calls made to `os.stat`."""
+    calls = 0
+    real_stat = os.stat
+
+    def counting_stat(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return real_stat(*args, **kwargs)
+
+    os.stat = counting_stat
+    try:
+        func()
+    finally:
+        os.stat = real_stat
+    return calls
+
+
+def main():
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "tree"
+        entries = make_synthetic_tree(root, width, depth)
+
+        old = lambda: sum(1 for _ in iterdir_tree(root))
+        new = lambda: sum(1 for _ in Directory.get_tree_from_path(root))
+        assert list(iterdir_tree(root)) == list(Directory.get_tree_from_path(root))
+
+        print(f"Tree: width={width}, depth={depth}, {entries} entries")
+        for label, func in (("iterdir", old), ("scandir", new)):
+            print(
+                f"  {label:<8} {best_of(func) * 1000:9.1f} ms"
+                f"  {count_stat_calls(func):>8} stat calls"
+            )
+
+
+if __name__ == '__main__':
+    main()
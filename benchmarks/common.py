@@ -0,0 +1,62 @@
+# Helpers shared by the benchmarks
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import os, sys, time
+from pathlib import Path
+
+# Let the benchmarks be run as plain scripts from anywhere.
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def make_synthetic_tree(root:Path, width:int, depth:int, file_size:int=64):
+    """
+    Create a directory tree under `root` with `width` files and `width`
+    sub directories in every directory, `depth` levels deep.
+
+    :return: Number of entries (files + directories) created.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    payload = b"x" * file_size
+    count = 0
+    level = [root]
+    for d in range(depth):
+        next_level = []
+        for dir_path in level:
+            for i in range(width):
+                with open(os.path.join(dir_path, f"file_{i}.txt"), "wb") as f:
+                    f.write(payload)
+                count += 1
+                if d < depth - 1:
+                    sub = dir_path / f"dir_{i}"
+                    sub.mkdir()
+                    next_level.append(sub)
+                    count += 1
+        level = next_level
+    return count
+
+
+def python_env():
+    """
+    Environment for the child interpreters of the startup benchmarks: byte
+    code caching is forced on, since without `.pyc` files every run would
+    pay for compiling the modules too.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def best_of(func, repeat:int=5):
+    """Run `func` `repeat` times and return the fastest wall time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -4,16 +4,62 @@
 # Created On: Aug 21, 2023
 #
 
-from template_generator import Directory, ANSI_ESCAPE
-import sys, pyperclip
+# Only what every run needs is imported up front; `template_generator`
+# comes in after the arguments are parsed and `pyperclip` only when the
+# tree is actually copied.
+import sys, argparse, itertools
 from pathlib import Path
 
+# Trees longer than this are not copied to the clipboard.
+CLIPBOARD_MAX_LINES = 5000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Print the directory tree on the terminal (and copy it to the clipboard)."
+    )
+    parser.add_argument(
+        "directory", nargs="?", default=None,
+        help="directory to list (default: the current working directory)"
+    )
+    parser.add_argument(
+        "-d", "--max-depth", type=int, default=None,
+        help="list at most this many levels"
+    )
+    parser.add_argument(
+        "-n", "--max-entries", type=int, default=None,
+        help="stop after this many entries"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="read sub directories ahead on this many threads (for network filesystems)"
+    )
+    parser.add_argument(
+        "--index", nargs="?", const="", default=None, metavar="INDEX_FILE",
+        help="reuse the listings of unchanged directories from this cache file "
+             "(default: ~/.cache/template_generator/tree_index.json)"
+    )
+    parser.add_argument(
+        "-o", "--output", default=None,
+        help="also write the tree (without colors) to this file"
+    )
+    parser.add_argument(
+        "--no-clipboard", action="store_true",
+        help="don't copy the tree to the clipboard"
+    )
+    return parser.parse_args()
+
+
 def main():
-    if len(sys.argv) < 2:
+    args = parse_args()
+
+    from template_generator import Directory, ANSI_ESCAPE
+
+    if args.directory is None:
         given_dir = Path.cwd()
 
-    elif len(sys.argv) == 2:
-        given_dir_path = Path(sys.argv[1])
+    else:
+        given_dir_path = Path(args.directory)
         if given_dir_path.exists():
             given_dir = given_dir_path
         else:
@@ -23,25 +69,45 @@ def main():
             else:
                 given_dir = Path.home() / given_dir_path
 
-    else:
-        msg = f"""::: ERROR :::
-        Script: {sys.argv[0]}
-
-        USAGE: 1. python3 {sys.argv[0]}
-               2. python3 {sys.argv[0]} <directory>
-        """
-        print(msg)
-        sys.exit(1)
+    index = None
+    if args.index is not None:
+        from template_generator import TreeIndex
+        index = TreeIndex(args.index or None)
+    lines = Directory.get_tree_from_path(
+        given_dir, max_depth=args.max_depth, workers=args.workers, index=index
+    )
+    if args.max_entries is not None:
+        lines = itertools.islice(lines, args.max_entries)
 
+    # Lines kept for the clipboard; dropped once the tree gets too long.
+    clipboard_lines = None if args.no_clipboard else []
+    output_file = open(args.output, "w") if args.output else None
 
-    given_dir_tree = "\n".join(Directory.get_tree_from_path(given_dir))
+    try:
+        # Print the tree with ANSI on the terminal as it is being scanned
+        for line in lines:
+            print(line)
 
-    # Print the tree with ANSI on the terminal
-    print(given_dir_tree)
+            if output_file is not None or clipboard_lines is not None:
+                # Escape ANSI
+                plain_line = ANSI_ESCAPE.sub('', line)
+                if output_file is not None:
+                    output_file.write(plain_line + "\n")
+                if clipboard_lines is not None:
+                    clipboard_lines.append(plain_line)
+                    if len(clipboard_lines) > CLIPBOARD_MAX_LINES:
+                        clipboard_lines = None
+    finally:
+        if output_file is not None:
+            output_file.close()
+        if index is not None:
+            index.save()
 
-    # Escape ANSI
-    given_dir_tree_without_ansi = ANSI_ESCAPE.sub('', given_dir_tree)
-    pyperclip.copy(given_dir_tree_without_ansi)
+    if clipboard_lines is not None:
+        import pyperclip
+        pyperclip.copy("\n".join(clipboard_lines))
+    elif not args.no_clipboard:
+        print(f"\n(More than {CLIPBOARD_MAX_LINES} lines; not copied to the clipboard.)")
     
 
 if __name__ == '__main__':
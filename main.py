@@ -4,19 +4,15 @@
 # Author: Indrajit Ghosh
 # Created on: Aug 20, 2023
 #
+# `template_generator` is imported by the template functions below, i.e.
+# only once `sys.argv` says which template (if any) is wanted.
 from pathlib import Path
-from template_generator import *
 import sys
 from scripts.utils import *
 
-TEMPLATES = [
-    "pyscript",
-    "pyproject",
-    "flaskapp",
-    "quit"
-]
-
 def pyscript_template():
+    from template_generator import ProjectTemplate
+
     # Functionality for pyscript template
     _script_name = input("Enter the python script name (e.g. `main.py`): ")
     _auth = input("Enter the author: ")
@@ -40,9 +36,12 @@ def pyscript_template():
     )
 
     _script.create_project()
+    return _script
 
 
 def pyproject_template():
+    from template_generator import ProjectTemplate
+
     # Functionality for pyproject template
     _proj_name = input("Enter the name of the project: ")
 
@@ -61,9 +60,12 @@ def pyproject_template():
     )
 
     pyproj.create_project()
+    return pyproj
 
 
 def flaskapp_template():
+    from template_generator import ProjectTemplate
+
     # Functionality for flaskapp template
     _app_name = input("Enter the name of the Flask app: ")
 
@@ -82,13 +84,66 @@ def flaskapp_template():
     )
 
     _app.create_project()
+    return _app
+
+
+def plugin_template(template:str):
+    from template_generator import ProjectTemplate
+
+    # Functionality for the templates of the plugins
+    _proj_name = input("Enter the name of the project: ")
+
+    _auth = input("Enter the author: ")
+    _auth = (
+        "Indrajit Ghosh"
+        if _auth == ''
+        else _auth
+    )
+
+    _proj = ProjectTemplate(
+        project_name=_proj_name,
+        project_author=_auth,
+        root_dir=Path.cwd(),
+        template=template
+    )
+
+    _proj.create_project()
+    return _proj
+
+
+# The built in templates' prompts; every other template of the registry
+# (see `template_generator.registry`) gets `plugin_template`.
+TEMPLATE_FUNCTIONS = {
+    "pyscript": pyscript_template,
+    "pyproject": pyproject_template,
+    "flaskapp": flaskapp_template
+}
+
+
+def print_timings(project, timings_path:str=None):
+    """Print the per-phase timings of `project` and save them as JSON to `timings_path`."""
+    print("Timings:")
+    print(project.timings.report())
+    if timings_path:
+        project.timings.to_json(timings_path)
+        print(f"\nTimings saved to `{timings_path}`.")
 
 
 def main():
-    if len(sys.argv) < 2:
-        template_choice = choose_from_list(TEMPLATES)
-    elif len(sys.argv) == 2:
-        template_choice = sys.argv[1]
+    # `--timings` prints the time spent in each phase; `--timings=FILE`
+    # also saves them as JSON.
+    args = sys.argv[1:]
+    show_timings, timings_path = False, None
+    for arg in list(args):
+        if arg == '--timings' or arg.startswith('--timings='):
+            show_timings, timings_path = True, arg.partition('=')[2]
+            args.remove(arg)
+
+    if len(args) < 1:
+        from template_generator.registry import template_names
+        template_choice = choose_from_list(template_names() + ["quit"])
+    elif len(args) == 1:
+        template_choice = args[0]
 
     else:
         msg = r"""TemplateGenerator
@@ -97,21 +152,34 @@ Author: Indrajit Ghosh
 Usages:
     1. python3 main.py
     2. python3 main.py pyproject
+    3. python3 main.py pyproject --timings[=timings.json]
 """
         print(msg)
 
         sys.exit(1)
 
-    if template_choice == 'pyscript':
-        pyscript_template()
-    elif template_choice == 'pyproject':
-        pyproject_template()
-    elif template_choice == 'flaskapp':
-        flaskapp_template()
-    elif template_choice == 'quit':
+    if template_choice == 'quit':
         sys.exit()
-    else:
+
+    from template_generator.registry import has_template
+    from template_generator.spec import SpecError
+
+    if template_choice not in TEMPLATE_FUNCTIONS and not has_template(template_choice):
         print(f"ERROR: Unknown template '{template_choice}'.\n")
+        return
+
+    try:
+        if template_choice in TEMPLATE_FUNCTIONS:
+            project = TEMPLATE_FUNCTIONS[template_choice]()
+        else:
+            project = plugin_template(template_choice)
+    except SpecError as e:
+        # A plugin template whose spec can't be loaded or compiled.
+        print(f"ERROR: {e}\n")
+        sys.exit(1)
+
+    if show_timings:
+        print_timings(project, timings_path)
 
 
 if __name__ == '__main__':
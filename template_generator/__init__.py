@@ -1,9 +1,35 @@
 # template_generator/__init__.py
 
 # Import statements
-from .terminal_style import IndraStyle
 from .model import *
+from .model import __all__ as _model_all
 from .constants import ANSI_ESCAPE
 
 # Package-level variables
-version = "1.0"
\ No newline at end of file
+version = "1.0"
+
+# Only the eagerly imported names: `from template_generator import *`
+# would import the lazy ones below otherwise.
+__all__ = _model_all + [
+    "ANSI_ESCAPE",
+    "version"
+]
+
+# Names imported on first use, to keep `import template_generator` fast.
+_LAZY_NAMES = {
+    "IndraStyle": ".terminal_style",
+    "TreeIndex": ".tree_index",
+    "TreeStore": ".tree_store",
+    "BlobStore": ".blob_store",
+    "PhaseTimings": ".timings",
+    "WritePlan": ".plan",
+    "register_template": ".registry",
+    "template_names": ".registry"
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        from importlib import import_module
+        return getattr(import_module(_LAZY_NAMES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
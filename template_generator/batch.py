@@ -0,0 +1,192 @@
+# Generate many projects at once from a manifest
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import csv, io, json, subprocess, sys, time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from .model import ProjectTemplate
+from .registry import has_template, get_plan
+from .spec import SpecError
+
+__all__ = [
+    "load_manifest",
+    "generate_batch",
+    "plan_batch",
+    "write_summary"
+]
+
+SUMMARY_FIELDS = ("row", "template", "project_name", "status", "path", "seconds", "error")
+
+DEFAULT_AUTHOR = "Indrajit Ghosh"
+
+
+def load_manifest(manifest_path:Path):
+    """
+    Read a JSON or CSV manifest of projects to generate.
+
+    A JSON manifest is a list of objects and a CSV manifest has a header row;
+    either way every row has the keys `template` and `project_name`, and
+    optionally `author` and `root_dir` (defaults: "Indrajit Ghosh" and the
+    current working dir).
+
+    :param `manifest_path`: Path of the `.json` or `.csv` manifest.
+    :return: A list of row dicts with all four keys filled in.
+    """
+    manifest_path = Path(manifest_path)
+    if manifest_path.suffix.lower() == '.json':
+        with manifest_path.open() as f:
+            raw_rows = json.load(f)
+        if not isinstance(raw_rows, list):
+            raise ValueError(f"{manifest_path}: expected a list of objects.")
+    elif manifest_path.suffix.lower() == '.csv':
+        with manifest_path.open(newline='') as f:
+            raw_rows = list(csv.DictReader(f))
+    else:
+        raise ValueError(f"{manifest_path}: manifest must be a `.json` or `.csv` file.")
+
+    rows = []
+    for num, raw in enumerate(raw_rows, start=1):
+        if not isinstance(raw, dict):
+            raise ValueError(f"{manifest_path}, row {num}: expected an object, got {type(raw).__name__}.")
+        for key in ("template", "project_name", "author", "root_dir"):
+            if not isinstance(raw.get(key) or "", str):
+                raise ValueError(
+                    f"{manifest_path}, row {num}: `{key}` must be a string, got {type(raw[key]).__name__}."
+                )
+
+        template = (raw.get("template") or "").strip()
+        project_name = (raw.get("project_name") or "").strip()
+        if not has_template(template):
+            raise ValueError(f"{manifest_path}, row {num}: unknown template '{template}'.")
+        if not project_name:
+            raise ValueError(f"{manifest_path}, row {num}: `project_name` is required.")
+
+        rows.append({
+            "template": template,
+            "project_name": project_name,
+            "author": (raw.get("author") or "").strip() or DEFAULT_AUTHOR,
+            "root_dir": (raw.get("root_dir") or "").strip() or str(Path.cwd())
+        })
+
+    return rows
+
+
+def _generate_row(num:int, row:dict):
+    """Create the project described by `row`; runs inside a worker process."""
+    result = {
+        "row": num,
+        "template": row["template"],
+        "project_name": row["project_name"],
+        "status": "ok",
+        "path": None,
+        "seconds": None,
+        "error": None
+    }
+    start = time.perf_counter()
+    # Keep the per-project messages of `create_project` off the console, but
+    # not the errors it only prints (e.g. a virtualenv that couldn't be made).
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output):
+            proj_path = ProjectTemplate(
+                project_name=row["project_name"],
+                template=row["template"],
+                project_author=row["author"],
+                root_dir=row["root_dir"]
+            ).create_project()
+        result["path"] = str(proj_path)
+    except (Exception, SystemExit) as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+    printed_errors = [
+        line.strip() for line in output.getvalue().splitlines()
+        if line.strip().startswith("ERROR:")
+    ]
+    if printed_errors:
+        result["status"] = "error"
+        result["error"] = "; ".join(filter(None, [*printed_errors, result["error"]]))
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def generate_batch(rows:list, workers:int=None):
+    """
+    Generate every project in `rows` on a pool of `workers` processes.
+
+    :param `rows`: Rows as returned by `load_manifest`.
+    :param `workers`: Number of worker processes (default: number of CPUs).
+    :return: One result dict per row (see `SUMMARY_FIELDS`), in manifest order.
+    """
+    # Compile the plans before the pool starts: forked workers then start
+    # with copy-on-write copies of them, static file bodies already encoded,
+    # instead of each compiling its own (spawned workers compile their own
+    # anyway). Nothing is shared back: each worker renders the variable
+    # bodies into its own copy of `render.RENDER_CACHE`, once per distinct
+    # output.
+    plans = []
+    for template in {row["template"] for row in rows}:
+        try:
+            plans.append(get_plan(template))
+        except SpecError:
+            pass # Its rows fail in the workers, with this error.
+    if any(plan.venv for plan in plans):
+        # Build the virtualenv seed once up front rather than in every worker.
+        try:
+            ProjectTemplate(project_name='')._get_venv_seed(sys.executable)
+        except (OSError, subprocess.CalledProcessError):
+            pass
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate_row, range(1, len(rows) + 1), rows))
+
+
+def plan_batch(rows:list):
+    """
+    Add up the `plan_project` totals of every project in `rows`, without
+    writing anything.
+
+    :param `rows`: Rows as returned by `load_manifest`.
+    :return: A dict of `projects`, `files`, `directories`, `inodes` and
+             `bytes`, plus `venv_unknown`: how many of the virtualenvs could
+             not be estimated (see `ProjectTemplate.plan_project`), and
+             `errors`: `(row, error)` of the rows whose template is broken,
+             which are left out of the totals.
+    """
+    totals = {"projects": 0, "files": 0, "directories": 0, "inodes": 0, "bytes": 0}
+    venv_unknown = 0
+    errors = []
+    for num, row in enumerate(rows, start=1):
+        try:
+            plan = ProjectTemplate(
+                project_name=row["project_name"],
+                template=row["template"],
+                project_author=row["author"],
+                root_dir=row["root_dir"]
+            ).plan_project()
+        except ValueError as e: # `SpecError` included
+            errors.append((num, f"{type(e).__name__}: {e}"))
+            continue
+        totals["projects"] += 1
+        for key, value in plan.totals().items():
+            totals[key] += value
+        venv_unknown += not plan.venv_known
+    totals["venv_unknown"] = venv_unknown
+    totals["errors"] = errors
+    return totals
+
+
+def write_summary(results:list, summary_path:Path):
+    """Write the results of `generate_batch` to a `.json` or `.csv` file."""
+    summary_path = Path(summary_path)
+    if summary_path.suffix.lower() == '.csv':
+        with summary_path.open("w", newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with summary_path.open("w") as f:
+            json.dump(results, f, indent=4)
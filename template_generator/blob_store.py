@@ -0,0 +1,77 @@
+# A content-addressed store for file contents
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import hashlib
+
+__all__ = [
+    "BlobStore"
+]
+
+
+class BlobStore:
+    """
+    A content-addressed store of file contents.
+
+    Every distinct content is kept exactly once, under its SHA-256 digest, and
+    all the `File`s with that content share the same `bytes` object. Pass one
+    to `Directory.instantiate_dir_from_path(..., blob_store=...)` to
+    deduplicate a snapshot.
+
+    USAGE:
+        >>> store = BlobStore()
+        >>> snapshot = Directory.instantiate_dir_from_path("my_repo", blob_store=store)
+        >>> store.dedup_ratio
+        3.4
+    """
+    def __init__(self):
+        self._blobs = {} # digest -> content
+        self._refs = 0
+        self._logical_size = 0
+
+    def add(self, data:bytes):
+        """Store `data` (if it is new) and return its digest."""
+        digest = hashlib.sha256(data).digest()
+        self._blobs.setdefault(digest, data)
+        self._refs += 1
+        self._logical_size += len(data)
+        return digest
+
+    def get(self, digest:bytes):
+        return self._blobs[digest]
+
+    def __contains__(self, digest):
+        return digest in self._blobs
+
+    def __len__(self):
+        return len(self._blobs)
+
+    def __iter__(self):
+        return iter(self._blobs)
+
+    @property
+    def logical_size(self):
+        """Total size of all the contents added, duplicates included."""
+        return self._logical_size
+
+    @property
+    def stored_size(self):
+        """Total size of the distinct contents actually kept."""
+        return sum(len(data) for data in self._blobs.values())
+
+    @property
+    def dedup_ratio(self):
+        """`logical_size / stored_size`; 1.0 means nothing was deduplicated."""
+        stored = self.stored_size
+        return self._logical_size / stored if stored else 1.0
+
+    def stats(self):
+        return {
+            "files": self._refs,
+            "unique_blobs": len(self._blobs),
+            "logical_bytes": self._logical_size,
+            "stored_bytes": self.stored_size,
+            "dedup_ratio": round(self.dedup_ratio, 3)
+        }
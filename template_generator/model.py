@@ -5,17 +5,171 @@
 # Modified On: Mar 17, 2024
 #
 
-import subprocess, datetime, sys
+# `subprocess`, `shutil`, `concurrent.futures` etc. are imported where they
+# are used: most runs never need them, and they are slow to import.
+import sys, os, time
 from pathlib import Path
-from .constants import *
-from .terminal_style import IndraStyle
+from .constants import ANSI_ESCAPE
 
 __all__ = [
     "File",
     "Directory",
-    "ProjectTemplate"
+    "ProjectTemplate",
+    "DirectoryCreationError"
 ]
 
+
+class DirectoryCreationError(OSError):
+    """
+    Raised by `Directory.create` in parallel mode when one or more files
+    could not be written.
+
+    :param `errors`: A list of `(file_path, exception)` pairs, one per failed file.
+    """
+    def __init__(self, errors):
+        self.errors = errors
+        lines = [f"{path}: {err}" for path, err in errors]
+        super().__init__(
+            f"Failed to create {len(errors)} file(s):\n\t" + "\n\t".join(lines)
+        )
+
+
+# ioctl request that makes a copy-on-write clone of a file (btrfs, xfs, ...)
+_FICLONE = 0x40049409 if sys.platform.startswith('linux') else None
+
+
+def _copy_file(src_path, dst_path, chunk_size:int):
+    """
+    Copy `src_path` to `dst_path` without passing the bytes through Python
+    where the platform allows it. In order of preference: a reflink clone,
+    `os.copy_file_range`, `os.sendfile` and finally a chunked copy.
+    """
+    import shutil
+
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+
+        if _FICLONE is not None:
+            import fcntl
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                return
+            except OSError:
+                pass # Not supported by this filesystem (or across filesystems)
+
+        copied = 0
+        if hasattr(os, "copy_file_range"):
+            try:
+                while True:
+                    n = os.copy_file_range(src_fd, dst_fd, chunk_size, copied)
+                    if n == 0:
+                        return
+                    copied += n
+            except OSError:
+                pass
+
+        if hasattr(os, "sendfile"):
+            try:
+                while True:
+                    n = os.sendfile(dst_fd, src_fd, copied, chunk_size)
+                    if n == 0:
+                        return
+                    copied += n
+            except OSError:
+                pass
+
+        src.seek(copied)
+        shutil.copyfileobj(src, dst, chunk_size)
+
+
+def _fsync_path(path, is_dir:bool=False):
+    """
+    Flush `path` (a file, or a directory's entries) to stable storage.
+    Directories can't be opened on Windows, so there they are skipped.
+    """
+    if is_dir and os.name == 'nt':
+        return
+    flags = os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if is_dir else 0)
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _sync_tree(files, dirs, workers:int=None):
+    """
+    Flush a freshly written tree to stable storage: first the data of every
+    path in `files`, all at the same time on a thread pool so that the
+    filesystem can fold them into a few journal commits, and only then each
+    directory of `dirs`. Those are given parents first (as they were made)
+    and synced in the reverse order, so every directory is flushed after
+    its entries, files' contents included, and before its parent.
+    """
+    if files:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers if workers and workers > 1 else 8) as executor:
+            # `list` re-raises the first failed fsync, if any.
+            list(executor.map(_fsync_path, files))
+    for path in reversed(dirs):
+        _fsync_path(path, is_dir=True)
+
+
+def _same_file(path, other):
+    """True if `path` and `other` both exist and are the same file."""
+    try:
+        return os.path.samefile(path, other)
+    except OSError:
+        return False
+
+
+class _ClassAttributeOnFirstUse:
+    """
+    A class attribute whose value is computed by `factory` the first time it
+    is looked up; the value then replaces the descriptor on the class.
+    """
+    def __init__(self, factory):
+        self._factory = factory
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, owner):
+        value = self._factory()
+        setattr(owner, self._name, value)
+        return value
+
+
+def _intern(name):
+    """Intern a node name: the same names recur all over a large tree."""
+    return sys.intern(name) if type(name) is str else name
+
+
+def _builtin_templates():
+    from .registry import BUILTIN_TEMPLATES
+    return tuple(BUILTIN_TEMPLATES)
+
+
+def _directory_style():
+    from .terminal_style import IndraStyle
+    return {
+        "dir": IndraStyle.AQUA + IndraStyle.BOLD,
+        "file": IndraStyle.ORANGE,
+        "image": IndraStyle.CRIMSON,
+        "txt": IndraStyle.MEDIUM_ORCHID,
+        "pdf": IndraStyle.AQUA_MARINE,
+        "video": IndraStyle.PURPLE,
+        "py": IndraStyle.PINK,
+        "ipynb": IndraStyle.CADET_BLUE,
+        "json": IndraStyle.PALE_TURQUOISE,
+        "md": IndraStyle.GREEN_YELLOW,
+        "reset": IndraStyle.END,
+        "tex": IndraStyle.BLUE_VIOLET,
+        "bib": IndraStyle.CRIMSON
+    }
+
+
 class File:
     """
     A Python class to represent a File.
@@ -26,14 +180,36 @@ class File:
     :param `content`: Text content of the file.
     :param `binary_content`: Binary content of the file.
     :param `name`: Name of the file.
+    :param `source_path`: Path of a file on disk to take the binary content
+                          from. It is only read when the content is needed,
+                          i.e. by `create` or by accessing `binary_content`.
     """
-    def __init__(self, content=None, binary_content=None, name=None):
+    # No per instance `__dict__`: snapshots of big trees hold millions of these.
+    __slots__ = (
+        "_content",
+        "_binary_content",
+        "_name",
+        "_source_path",
+        "_blob_id"
+    )
+
+    # Size of the chunks a lazy file is streamed in.
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, content=None, binary_content=None, name=None, source_path=None):
         self._content = content
         self._binary_content = binary_content
-        self._name = name if name else "untitled_file"
+        self._name = _intern(name) if name else "untitled_file"
+        # Kept as a plain `str`, which is far smaller than a `Path`.
+        self._source_path = None if source_path is None else os.fspath(source_path)
+        # Digest of the content if it lives in a `BlobStore`.
+        self._blob_id = None
 
     @property
     def content(self):
+        if type(self._content) is memoryview:
+            # The utf-8 text of a loaded snapshot; decoded only when asked for.
+            return str(self._content, "utf-8")
         return self._content
     
     @content.setter
@@ -42,11 +218,20 @@ class File:
 
     @property
     def binary_content(self):
+        if self._binary_content is None and self._source_path is not None:
+            # Lazy file: read the source afresh, nothing is kept in memory.
+            with open(self._source_path, "rb") as f:
+                return f.read()
+        if isinstance(self._binary_content, memoryview):
+            # A slice of a loaded snapshot; copied out only when asked for.
+            return self._binary_content.tobytes()
         return self._binary_content
     
     @binary_content.setter
     def binary_content(self, new):
         self._binary_content = new
+        self._source_path = None
+        self._blob_id = None
 
     @property
     def name(self):
@@ -54,26 +239,80 @@ class File:
     
     @name.setter
     def name(self, new_name):
-        self._name = new_name if new_name else "untitled_file"
+        self._name = _intern(new_name) if new_name else "untitled_file"
+
+    @property
+    def source_path(self):
+        return None if self._source_path is None else Path(self._source_path)
+
+    @property
+    def is_lazy(self):
+        """True if the content is still on disk at `source_path`."""
+        return self._binary_content is None and self._source_path is not None
+
+    @property
+    def blob_id(self):
+        """SHA-256 digest of the content if it was stored in a `BlobStore`."""
+        return self._blob_id
+
+    @property
+    def size(self):
+        """Number of bytes `create` writes; a lazy file's source is only stat-ed."""
+        if self.is_lazy:
+            return os.stat(self._source_path).st_size
+        if self._binary_content:
+            return len(self._binary_content)
+        if type(self._content) is memoryview:
+            return len(self._content)
+        if self._content:
+            return len(self._content.encode())
+        return 0
 
     @classmethod
-    def instantiate_from_file_path(cls, filepath: Path):
+    def instantiate_from_file_path(cls, filepath: Path, lazy: bool=False, blob_store: 'BlobStore'=None):
+        """
+        Create a File from the file at `filepath`.
+
+        :param `lazy`: Don't read the file now, see `source_path`.
+        :param `blob_store`: Keep the content in this `BlobStore`, so that it is
+                             shared with every other file of the same content.
+        """
         filepath = Path(filepath)
+        if lazy:
+            return cls(name=filepath.name, source_path=filepath)
         with filepath.open("rb") as f:
             binary_content = f.read()
-        return cls(binary_content=binary_content, name=filepath.name)
+        blob_id = None
+        if blob_store is not None:
+            blob_id = blob_store.add(binary_content)
+            binary_content = blob_store.get(blob_id)
+        file = cls(binary_content=binary_content, name=filepath.name)
+        file._blob_id = blob_id
+        return file
+
+    def create(self, path, fsync:bool=False):
+        """
+        Write the file into the directory `path`.
 
-    def create(self, path):
+        :param `fsync`: Flush the file to stable storage before returning.
+        """
         path = Path(path) / self._name
-        if self._binary_content:
+        if self.is_lazy:
+            # Copied from the source, unless that is where it's being written:
+            # opening it for writing would truncate the only copy.
+            if not _same_file(self._source_path, path):
+                _copy_file(self._source_path, path, self.CHUNK_SIZE)
+        elif self._binary_content or type(self._content) is memoryview:
             with path.open("wb") as f:
-                f.write(self._binary_content)
+                f.write(self._binary_content or self._content)
         elif self._content:
             with path.open("w") as f:
                 f.write(self._content)
         else:
             with path.open("w") as f:
                 f.write("")
+        if fsync:
+            _fsync_path(path)
 
 class Directory:
     """
@@ -89,25 +328,42 @@ class Directory:
         'venv'
     )
 
-    STYLE = {
-        "dir": IndraStyle.AQUA + IndraStyle.BOLD,
-        "file": IndraStyle.ORANGE,
-        "image": IndraStyle.CRIMSON,
-        "txt": IndraStyle.MEDIUM_ORCHID,
-        "pdf": IndraStyle.AQUA_MARINE,
-        "video": IndraStyle.PURPLE,
-        "py": IndraStyle.PINK,
-        "ipynb": IndraStyle.CADET_BLUE,
-        "json": IndraStyle.PALE_TURQUOISE,
-        "md": IndraStyle.GREEN_YELLOW,
-        "reset": IndraStyle.END,
-        "tex": IndraStyle.BLUE_VIOLET,
-        "bib": IndraStyle.CRIMSON
-    }
+    __slots__ = (
+        "_content",
+        "_name",
+        "_index",
+        "_index_stamp"
+    )
+
+    # Bumped whenever a sub directory is replaced (or a `content` dict is
+    # swapped) anywhere: an index built before may point at a detached
+    # Directory, so it is dropped on its next use (see `_valid_index`).
+    _detached:int = 0
+
+    # How much `create` does to survive a crash:
+    #   none:    leave the writes to the OS's page cache.
+    #   batched: once everything is written, fsync every file (all at the
+    #            same time), then each directory once, children before
+    #            parents and the parent dir last (see `_sync_tree`).
+    #   strict:  fsync every file as it is written, then the directories as
+    #            in `batched`.
+    DURABILITY = (
+        "none",
+        "batched",
+        "strict"
+    )
+
+    # Built from `IndraStyle` on first use, so that importing the package
+    # doesn't have to load `terminal_style`.
+    STYLE = _ClassAttributeOnFirstUse(_directory_style)
 
     def __init__(self, name=None):
         self._content = {}
-        self._name = name if name else "untitled_directory"
+        self._name = _intern(name) if name else "untitled_directory"
+        # "a/b" -> the Directory at that path, built up by the path methods,
+        # and the `_detached` count it is current for.
+        self._index = None
+        self._index_stamp = 0
 
     @property
     def content(self):
@@ -116,6 +372,8 @@ class Directory:
     @content.setter
     def content(self, new):
         self._content = new
+        self._index = None
+        Directory._detach()
 
     @property
     def name(self):
@@ -123,27 +381,302 @@ class Directory:
     
     @name.setter
     def name(self, new_name):
-        self._name = new_name if new_name else "untitled_directory"
+        self._name = _intern(new_name) if new_name else "untitled_directory"
 
     def add_file(self, name, content=None, binary_content=None):
+        if type(self._content.get(name)) is Directory:
+            Directory._detach()
         self._content[name] = File(content, binary_content, name)
 
     def add_directory(self, name):
+        if type(self._content.get(name)) is Directory:
+            Directory._detach()
         self._content[name] = Directory(name)
 
-    def create(self, path):
+    # Path based access. `path` is relative to this directory and uses `/`
+    # (e.g. "app/templates/errors/404.html"). The directories on the way are
+    # kept in an index, so finding the parent of an insert next to earlier
+    # ones is one dict lookup however deep it is (splitting the path is
+    # still linear in its length). Replacing a sub directory with
+    # `insert`, `add_file`, `add_directory` or the `content` setter, on
+    # any Directory, drops the indexes built before it; call `reindex`
+    # after replacing one by editing a `content` dict in place.
+
+    @classmethod
+    def _detach(cls):
+        cls._detached += 1
+
+    def _valid_index(self):
+        """The path index, emptied first if a directory was replaced since it was built."""
+        index = self._index
+        if index is None or self._index_stamp != Directory._detached:
+            index = self._index = {}
+            self._index_stamp = Directory._detached
+        return index
+
+    @staticmethod
+    def _split_path(path):
+        """
+        `(key, parent_key, name)` of `path`, e.g. `("app/static/styles.css",
+        "app/static", "styles.css")`.
+        """
+        key = path if type(path) is str else os.fspath(path)
+        if os.sep != '/':
+            key = key.replace(os.sep, '/')
+        parent_key, _, name = key.rpartition('/')
+        if not name or ('..' in key and '..' in key.split('/')):
+            # A '..' would make a directory of that name, which `create`
+            # can't write; a trailing '/' leaves the entry without a name.
+            raise ValueError(f"Invalid entry path '{path}'.")
+        if (
+            name == '.' or key[0] == '/' or '//' in key
+            or parent_key == '.' or parent_key.startswith('./') or '/./' in key
+        ):
+            # Not in the usual "a/b/c" form: normalize it.
+            parts = [part for part in key.split('/') if part and part != '.']
+            if not parts:
+                raise ValueError(f"Invalid entry path '{path}'.")
+            key = "/".join(parts)
+            parent_key, _, name = key.rpartition('/')
+        return key, parent_key, name
+
+    def _directory_at(self, key:str, create:bool):
+        """
+        The Directory at `key` ("" is `self`), making the missing ones if
+        `create`, else None when there is none.
+        """
+        if not key:
+            return self
+        directory = self._index.get(key)
+        if directory is not None:
+            return directory
+
+        parent_key, _, name = key.rpartition('/')
+        parent = self._directory_at(parent_key, create)
+        if parent is None:
+            return None
+        directory = parent._content.get(name)
+        if directory is None:
+            if not create:
+                return None
+            directory = parent._content[name] = Directory(name)
+        elif not isinstance(directory, Directory):
+            if not create:
+                return None
+            raise NotADirectoryError(f"'{key}' is a file, not a directory.")
+        self._index[key] = directory
+        return directory
+
+    def get(self, path, default=None):
+        """
+        The File or Directory at `path` (relative to this directory), or
+        `default` if there is none.
+        """
+        _, parent_key, name = self._split_path(path)
+        self._valid_index()
+        parent = self._directory_at(parent_key, create=False)
+        if parent is None:
+            return default
+        return parent._content.get(name, default)
+
+    def insert(self, path, entry):
+        """
+        Put `entry` at `path`, creating the missing directories on the way
+        and replacing whatever was at `path`.
+
+        :param `path`: Where the entry goes, relative to this directory.
+        :param `entry`: A `File` or `Directory` (renamed to the last part of
+                        `path`), or a `str`/`bytes` for a file with that
+                        text/binary content.
+        :return: The inserted `File` or `Directory`.
+        """
+        key, parent_key, name = self._split_path(path)
+        if type(entry) is str:
+            entry = File(entry, None, name)
+        elif isinstance(entry, (bytes, bytearray, memoryview)):
+            entry = File(None, entry, name)
+        elif isinstance(entry, (File, Directory)):
+            entry.name = name
+        else:
+            raise TypeError(f"Can't insert a {type(entry).__name__} at '{path}'.")
+
+        index = self._valid_index()
+        parent = self._directory_at(parent_key, create=True)
+        content = parent._content
+        if type(content.get(name)) is Directory:
+            # Entries below `key` in this index (and in any other) go stale.
+            Directory._detach()
+            index = self._valid_index()
+        content[name] = entry
+        if type(entry) is Directory:
+            index[key] = entry
+        return entry
+
+    def bulk_insert(self, entries):
+        """
+        `insert` every `(path, entry)` of `entries` (a dict or an iterable of
+        pairs), in order.
+        """
+        if isinstance(entries, dict):
+            entries = entries.items()
+        index = self._valid_index()
+        for path, entry in entries:
+            # The usual case inline: text content going into a directory
+            # that is already indexed (so its path is normalized and free
+            # of '..') and in place of no directory. Anything else, invalid
+            # names included, goes through `insert` and its checks.
+            if type(path) is str and type(entry) is str and os.sep == '/':
+                parent_key, _, name = path.rpartition('/')
+                parent = index.get(parent_key) if parent_key else self
+                if parent is not None and name and name != '.' and name != '..':
+                    content = parent._content
+                    if type(content.get(name)) is not Directory:
+                        content[name] = File(entry, None, name)
+                        continue
+            self.insert(path, entry)
+            index = self._index
+
+    def reindex(self):
+        """Forget the path index; it is rebuilt by the next path lookups."""
+        self._index = None
+
+    def create(self, path, workers:int=None, exist_ok:bool=False, durability:str="none"):
+        """
+        Create the directory and all of its contents under `path`.
+
+        :param `path`: Parent directory in which `self` is created.
+        :param `workers`: If given (and > 1), all the directories are made
+                          first and then the files are written concurrently
+                          on a pool of `workers` threads. Failures are
+                          collected per file and raised together as a
+                          `DirectoryCreationError` once every write finished.
+        :param `exist_ok`: Don't fail if the top level directory already exists.
+        :param `durability`: One of `DURABILITY`: "none" (default),
+                             "batched" or "strict".
+        """
+        if durability not in self.DURABILITY:
+            raise ValueError(
+                f"Unknown durability '{durability}', expected one of {self.DURABILITY}."
+            )
+        fsync_files = durability == "strict"
+
+        if workers is not None and workers > 1:
+            self._create_parallel(path, workers, exist_ok, fsync_files)
+        else:
+            self._create_serial(path, exist_ok, fsync_files)
+
+        if durability != "none":
+            self._sync(path, sync_files=durability == "batched", workers=workers)
+
+    def _create_serial(self, path, exist_ok:bool=False, fsync_files:bool=False):
         root_path = Path(path) / self._name
-        root_path.mkdir(parents=True)
+        root_path.mkdir(parents=True, exist_ok=exist_ok)
 
         for name, entry in self._content.items():
             
             if isinstance(entry, File):
                 entry.name = name
-                entry.create(root_path)
+                entry.create(root_path, fsync=fsync_files)
             elif isinstance(entry, Directory):
-                entry.create(root_path)
+                entry._create_serial(root_path, fsync_files=fsync_files)
+
+    def _sync(self, path, sync_files:bool, workers:int=None):
+        """
+        Flush the tree created under `path` to stable storage: the files (if
+        `sync_files`), every directory and `path` itself (for the new top
+        level entry); see `_sync_tree`.
+        """
+        files, dirs = [], [Path(path), Path(path) / self._name]
+        for parent_path, entry in self._walk(path):
+            if isinstance(entry, Directory):
+                dirs.append(parent_path / entry._name)
+            elif sync_files:
+                files.append(parent_path / entry.name)
+        _sync_tree(files, dirs, workers)
+
+    def _walk(self, path):
+        """
+        Yield `(parent_path, entry)` for every entry below `self` in
+        pre-order, i.e. each directory comes before its contents.
+        """
+        root_path = Path(path) / self._name
+        stack = [(root_path, self)]
+        while stack:
+            dir_path, directory = stack.pop()
+            subdirs = []
+            for name, entry in directory._content.items():
+                if isinstance(entry, File):
+                    entry.name = name
+                    yield dir_path, entry
+                elif isinstance(entry, Directory):
+                    yield dir_path, entry
+                    subdirs.append((dir_path / entry._name, entry))
+            stack.extend(reversed(subdirs))
+
+    def plan(self, path='.'):
+        """
+        Work out what `create(path)` would write, without writing anything.
+
+        Only lazy files touch the disk, to `stat` their source.
+
+        :return: A `WritePlan` of every directory and file path.
+        """
+        from .plan import WritePlan
+
+        entries = [(Path(path) / self._name, None)]
+        for parent_path, entry in self._walk(path):
+            if isinstance(entry, File):
+                entries.append((parent_path / entry.name, entry.size))
+            else:
+                entries.append((parent_path / entry._name, None))
+        return WritePlan(entries)
+
+    def _create_parallel(self, path, workers:int, exist_ok:bool=False, fsync_files:bool=False):
+        from concurrent.futures import ThreadPoolExecutor
+
+        root_path = Path(path) / self._name
+        root_path.mkdir(parents=True, exist_ok=exist_ok)
+
+        # Make every directory first so that file writes never race a mkdir.
+        files = []
+        for parent_path, entry in self._walk(path):
+            if isinstance(entry, Directory):
+                (parent_path / entry._name).mkdir()
+            else:
+                files.append((parent_path, entry))
+
+        def _write(item):
+            parent_path, file = item
+            try:
+                file.create(parent_path, fsync=fsync_files)
+            except OSError as e:
+                return parent_path / file.name, e
+            return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = [err for err in executor.map(_write, files) if err is not None]
+
+        if errors:
+            raise DirectoryCreationError(errors)
 
 
+    def save(self, path):
+        """
+        Save the directory with all of its contents into the single
+        snapshot file `path`; see `Directory.load`.
+        """
+        from .snapshot import save_directory
+        save_directory(self, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a directory saved by `Directory.save`. The snapshot is
+        memory-mapped and the file contents are read from it on demand.
+        """
+        from .snapshot import load_directory
+        return load_directory(path)
+
     def _generate_entry_strings(self, level=0):
         indent = "    "
         for name, entry in self._content.items():
@@ -159,34 +692,34 @@ class Directory:
     @classmethod
     def _colored_entry(cls, entry_name, entry_type):
         if entry_type == "File":
-            fileobj = Path(entry_name)
+            suffix = os.path.splitext(entry_name)[1]
 
-            if fileobj.suffix == '.py':
+            if suffix == '.py':
                 color_code = cls.STYLE['py']
 
-            elif fileobj.suffix == '.pdf':
+            elif suffix == '.pdf':
                 color_code = cls.STYLE['pdf']
 
-            elif fileobj.suffix == '.tex':
+            elif suffix == '.tex':
                 color_code = cls.STYLE['tex']
 
-            elif fileobj.suffix == '.txt':
+            elif suffix == '.txt':
                 color_code = cls.STYLE['txt']
 
-            elif fileobj.suffix in ['.jpg', '.png', '.jpeg', '.JPG', '.PNG', 'JPEG']:
+            elif suffix in ['.jpg', '.png', '.jpeg', '.JPG', '.PNG', 'JPEG']:
                 color_code = cls.STYLE['image']
 
-            elif fileobj.suffix in ['.mp4', '.mkv', '.mov', '.MOV']:
+            elif suffix in ['.mp4', '.mkv', '.mov', '.MOV']:
                 color_code = cls.STYLE['video']
 
-            elif fileobj.suffix == '.bib':
+            elif suffix == '.bib':
                 color_code = cls.STYLE['bib']
 
             else:
                 color_code = cls.STYLE['file']
 
         else:
-            color_code = IndraStyle.AQUA + IndraStyle.BOLD  # Green color for directories
+            color_code = cls.STYLE['dir']  # Green color for directories
 
         reset_code = "\033[0m"  # Reset color
 
@@ -224,40 +757,99 @@ class Directory:
     
 
     @classmethod
-    def instantiate_dir_from_path(cls, dir_path: Path):
+    def instantiate_dir_from_path(
+            cls,
+            dir_path: Path,
+            lazy: bool=False,
+            memory_budget: int=None,
+            blob_store: 'BlobStore'=None
+    ):
         """
         Create a Directory instance by instantiating it from a directory path.
 
         :param `dir_path`: Path to the directory.
+        :param `lazy`: If True, no file is read now. Every `File` just keeps
+                       its source path and streams it when it is created.
+        :param `memory_budget`: Maximum number of bytes to read into memory.
+                                Files that don't fit into what is left of the
+                                budget are kept lazy.
+        :param `blob_store`: A `BlobStore` to deduplicate the contents of the
+                             files read: identical files share one blob. See
+                             `BlobStore.dedup_ratio` afterwards.
         :return: A Directory instance representing the directory contents.
         """
-        dir_path = Path(dir_path)
-        directory = cls(name=dir_path.name)  # Create a Directory instance with the directory name
-        
-        for entry_path in dir_path.iterdir():
-            entry_name = entry_path.name
-
-            if entry_name in cls.IGNORE:
-                continue  # Skip specific directories
+        budget = None if memory_budget is None else [memory_budget]
+        return cls._instantiate_dir_from_path(
+            os.fspath(dir_path), Path(dir_path).name, lazy, budget, blob_store
+        )
 
-            if entry_path.is_file():
-                def read_file_content(file_path):
-                    with file_path.open("rb") as f:
-                        return f.read()
-                directory.add_file(entry_name, binary_content=read_file_content(entry_path))
-            elif entry_path.is_dir():
-                sub_directory = cls.instantiate_dir_from_path(entry_path)
-                directory.add_directory(entry_name)
-                directory._content[entry_name] = sub_directory
+    @classmethod
+    def _instantiate_dir_from_path(cls, dir_path: str, name: str, lazy: bool, budget: list, blob_store: 'BlobStore'):
+        directory = cls(name=name)  # Create a Directory instance with the directory name
+        
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                entry_name = sys.intern(entry.name)
+
+                if entry_name in cls.IGNORE:
+                    continue  # Skip specific directories
+
+                if entry.is_file():
+                    if not lazy and budget is not None:
+                        # Read the file only if it fits into the remaining budget.
+                        size = entry.stat().st_size
+                        file_lazy = size > budget[0]
+                        if not file_lazy:
+                            budget[0] -= size
+                    else:
+                        file_lazy = lazy
+                    directory._content[entry_name] = File.instantiate_from_file_path(
+                        entry.path, lazy=file_lazy, blob_store=blob_store
+                    )
+                elif entry.is_dir():
+                    directory._content[entry_name] = cls._instantiate_dir_from_path(
+                        entry.path, entry_name, lazy, budget, blob_store
+                    )
         
         return directory
     
     @classmethod
-    def get_tree_from_path(cls, dir_path: Path, prefix: str=''):
+    def get_tree_from_path(
+            cls,
+            dir_path: Path,
+            prefix: str='',
+            max_depth: int=None,
+            workers: int=None,
+            index=None
+    ):
         """A recursive generator, given a directory Path object
         will yield a visual tree structure line by line
         with each line prefixed by the same characters
+
+        `max_depth` limits how many levels are listed (1: only the
+        entries of `dir_path` itself).
+
+        With `workers` (> 1), the sub directories of each listed directory
+        are read ahead on a pool of that many threads, which helps on
+        filesystems with slow directory reads. The lines come out in
+        exactly the same order either way.
+
+        With an `index` (a `TreeIndex`), unchanged directories are listed
+        from the index instead of being read again.
         """
+        scan = cls._scan_dir if index is None else index.scan_dir
+        if workers is not None and workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                yield from cls._tree_lines(dir_path, prefix, max_depth, scan, executor)
+            finally:
+                executor.shutdown(cancel_futures=True)
+        else:
+            yield from cls._tree_lines(dir_path, prefix, max_depth, scan)
+
+    @classmethod
+    def _tree_lines(cls, dir_path, prefix, max_depth, scan, executor=None, contents=None):
         # prefixes:
         space =  '    '
         branch = '│   '
@@ -265,20 +857,54 @@ class Directory:
         # pointers:
         tee =    '├── '
         last =   '└── ' 
-        contents = list(dir_path.iterdir())
+        if contents is None:
+            contents = scan(dir_path)
+        descend = max_depth is None or max_depth > 1
+
+        # Start reading the sub directories while this level is yielded.
+        pending = {}
+        if executor is not None and descend:
+            pending = {
+                path: executor.submit(scan, path)
+                for name, path, _, is_dir in contents
+                if is_dir and name not in Directory.IGNORE
+            }
+
         # contents each get pointers that are ├── with a final └── :
         pointers = [tee] * (len(contents) - 1) + [last]
-        for pointer, path in zip(pointers, contents):
-            if path.name in Directory.IGNORE:
+        for pointer, (name, path, is_file, is_dir) in zip(pointers, contents):
+            if name in Directory.IGNORE:
                 continue  # Skip specific directories
             yield prefix + pointer + cls._colored_entry(
-                entry_name=path.name,
-                entry_type='File' if path.is_file() else 'Directory'
+                entry_name=name,
+                entry_type='File' if is_file else 'Directory'
             )
-            if path.is_dir(): # extend the prefix and recurse:
+            if is_dir and descend: # extend the prefix and recurse:
                 extension = branch if pointer == tee else space 
                 # i.e. space because last, └── , above so no more |
-                yield from cls.get_tree_from_path(path, prefix=prefix+extension)
+                yield from cls._tree_lines(
+                    path,
+                    prefix=prefix+extension,
+                    max_depth=None if max_depth is None else max_depth - 1,
+                    scan=scan,
+                    executor=executor,
+                    contents=pending[path].result() if pending else None
+                )
+
+    @staticmethod
+    def _scan_dir(dir_path):
+        """
+        List `dir_path` as `(name, path, is_file, is_dir)` tuples.
+
+        `os.scandir` gets the entry types along with the names, so unlike
+        `Path.is_file()`/`Path.is_dir()` this needs no `stat` call per entry
+        (except for symlinks, which still have to be followed).
+        """
+        with os.scandir(dir_path) as entries:
+            return [
+                (entry.name, entry.path, entry.is_file(), entry.is_dir())
+                for entry in entries
+            ]
 
 
 class ProjectTemplate:
@@ -289,14 +915,28 @@ class ProjectTemplate:
     Author: Indrajit Ghosh
     Created On: Aug 20, 2023
     """
-    TODAY:str = datetime.datetime.strftime(datetime.datetime.now(), '%b %d, %Y')
+    TODAY:str = time.strftime('%b %d, %Y')
+
+    # The built in templates; `registry.template_names()` lists the plugged
+    # in ones too.
+    TEMPLATES = _ClassAttributeOnFirstUse(_builtin_templates)
+
+    # Pristine virtualenvs, one per interpreter, that new envs are cloned from.
+    VENV_SEED_CACHE:Path = Path.home() / ".cache" / "template_generator" / "venv_seeds"
+
+    # `_tree_size` of every seed env, for the timings and plans.
+    _SEED_SIZES = {}
 
     def __init__(
             self, 
             project_name:str, 
             template:str='pyproject', 
             project_author:str="Indrajit Ghosh",
-            root_dir:Path=None
+            root_dir:Path=None,
+            use_venv_cache:bool=True,
+            create_venv:bool=True,
+            on_phase=None,
+            durability:str="none"
     ):
         self._project_name:str = project_name
         self._template:str = template
@@ -306,459 +946,341 @@ class ProjectTemplate:
             else Path(root_dir)
         )
         self._author = project_author
+        self._use_venv_cache = use_venv_cache
+        self._create_venv = create_venv
+        self._on_phase = on_phase
+        # See `Directory.DURABILITY`; the virtualenv is never synced, it can
+        # always be rebuilt.
+        if durability not in Directory.DURABILITY:
+            raise ValueError(
+                f"Unknown durability '{durability}', expected one of {Directory.DURABILITY}."
+            )
+        self._durability = durability
+        from .timings import PhaseTimings
+
+        self._timings = PhaseTimings(on_phase)
+
+    @property
+    def timings(self):
+        """
+        `PhaseTimings` of the last `create_project` call: wall time, files
+        and bytes written of `build_tree`, `write_files` and the virtualenv
+        phases (`venv_seed`, `venv_clone`, or `venv_probe` and `venv_create`).
+        `on_phase`, if given, is called with every phase as it finishes.
+        """
+        return self._timings
 
     def create_project(self):
+        """
+        Create the project from the template.
 
-        # Create the project_dir
-        if self._template == 'pyproject':
-            proj_dir: Path = self._create_pyproject_template()
-        elif self._template == 'flaskapp':
-            proj_dir: Path = self._create_flaskapp_template()
-        elif self._template == 'pyscript':
-            _script_name = self._project_name.lower().replace(' ', '_')
-
-            # Create `_script_name.py`
-            script = File(
-                name=_script_name + ".py",
-                content=SCRIPT_MAIN_PY % (_script_name, self._author, self.TODAY)
-            )
-            script.create(path=self._root_dir)
-            
-        else:
+        Returns:
+        --------
+            `project_path`: Path of the created project dir (or script).
+        """
+        from .registry import has_template
+        from .timings import PhaseTimings
+
+        self._timings = PhaseTimings(self._on_phase)
+
+        if not has_template(self._template):
             print("Invalid template name")
             sys.exit(1)
+
+        with self._timings.phase("build_tree"):
+            plan = self._plan()
+            variables = self._variables(plan)
+            operations = plan.render(variables)
+            root = plan.root_name(variables)
+
+        # Create the project_dir
+        if root is None:
+            self._write_files(plan, variables, operations)
+            proj_dir: Path = self._root_dir / operations[0][0]
+        else:
+            proj_dir: Path = self._create_project_dir(plan, variables, operations)
         
         # Print necessary info
-        if self._template != 'pyscript':
+        if root is not None:
             msg = (
                 f"\n1. A `{self._template}` has been created at the following dir:"
-                + f"\n\t`{proj_dir}`"
-                + "\n\n2. A virtualenv has been created too. You can use the following cmds to activate it:"
-                + f"\n\t- cd {proj_dir}"
-                + "\n\t- source env/bin/activate\n"
+                + f"\n\t`{proj_dir}`\n"
             )
+            step = 2
 
-            if self._template == 'flaskapp':
+            if plan.venv and self._create_venv:
                 msg += (
-                    "\n3. You can run the flaskapp by the following cmd:"
-                    + "\n\t- source env/bin/activate"
-                    + "\n\t- pip install -r requirements.txt"
-                    + "\n\t- env/bin/python run.py\n"
+                    f"\n{step}. A virtualenv has been created too. You can use the following cmds to activate it:"
+                    + f"\n\t- cd {proj_dir}"
+                    + "\n\t- source env/bin/activate\n"
+                )
+                step += 1
+
+            if plan.run_commands:
+                msg += (
+                    f"\n{step}. You can run the {self._template} by the following cmd:"
+                    + "".join(f"\n\t- {cmd}" for cmd in plan.run_commands)
+                    + "\n"
                 )
 
             print(msg)
 
         else:
-            print("\nA `pyscript` has been created at the following path:")
-            print(f"\t{self._root_dir}/{_script_name}.py\n")
+            print(f"\nA `{self._template}` has been created at the following path:")
+            print(f"\t{self._root_dir}/{operations[0][0]}\n")
 
+        return proj_dir
 
-    def _create_pyproject_template(self):
+    def plan_project(self):
         """
-        Creates a Python project.
+        Work out what `create_project` would write, without writing anything.
+
+        The virtualenv is estimated from the venv seed of the running
+        interpreter (see `VENV_SEED_CACHE`); until that seed has been built
+        its cost is unknown and left out of the totals.
 
         Returns:
         --------
-            `project_dir_path`: Path
+            `plan`: WritePlan
         """
-        _proj_name = "_".join(
-            [
-                e.title() 
-                for e in self._project_name.split(' ')
-            ]
-        )
-        _proj_module_name = _proj_name.lower()
-        _proj_dir_name = _proj_name.replace('_', '')
-        project_dir = Directory(name=_proj_dir_name)
-
-        # Add `_proj_name` dir
-        project_dir.add_directory(
-            name=_proj_module_name
-        )
-
-        # Add `_proj_name/__init__.py`
-        project_dir._content[_proj_module_name].add_file(
-            name="__init__.py",
-            content=PYPROJ_INIT_PY % _proj_name
-        )
-
-        # Add `_proj_name/model.py`
-        project_dir._content[_proj_module_name].add_file(
-            name="model.py",
-            content=MODEL_PY % (_proj_name, self._author, self.TODAY)
-        )
-
-        # Add .gitignore
-        project_dir.add_file(
-            name=".gitignore",
-            content=PY_GITIGNORE
-        )
-
-        # Add `main.py`
-        project_dir.add_file(
-            name="main.py",
-            content=MAIN_PY % (_proj_name, self._author, self.TODAY, _proj_module_name)
-        )
-
-        # Add `requirements.txt`
-        project_dir.add_file(
-            name="requirements.txt",
-            content=REQUIREMENTS
-        )
-
-        # Add `README.md`
-        project_dir.add_file(
-            name="README.md",
-            content=README_MD
-        )
-
-        # Add `setup.py`
-        project_dir.add_file(
-            name="setup.py"
-        )
-
-
-        # Create the project_dir
-        project_dir.create(path=self._root_dir)
-        project_dir_path: Path = self._root_dir / _proj_dir_name
-
-        # Create venv
-        self.create_virtualenv(
-            venv_path=project_dir_path / "env",
-            python_executable=sys.executable
-        )
+        from .plan import WritePlan
+        from .registry import has_template
+
+        if not has_template(self._template):
+            raise ValueError(f"Invalid template name '{self._template}'.")
+        plan = self._plan()
+
+        variables = self._variables(plan)
+        root = plan.root_name(variables)
+        project_dir_path = self._root_dir if root is None else self._root_dir / root
+        entries = [] if root is None else [(project_dir_path, None)]
+        entries += [
+            (project_dir_path / path, None if data is None else len(data))
+            for path, data in plan.render(variables)
+        ]
+        if not (plan.venv and self._create_venv):
+            return WritePlan(entries)
+
+        venv = {"files": None, "directories": None, "bytes": None}
+        seed_dir = self.VENV_SEED_CACHE / self._venv_seed_key(sys.executable)
+        if self._use_venv_cache and (seed_dir / "seed_path").is_file():
+            files, size, directories = self._seed_size(seed_dir)
+            # The seed's `env` dir itself is one more directory.
+            venv = {"files": files, "directories": directories + 1, "bytes": size}
+        return WritePlan(entries, venv=venv)
+
+    def _plan(self):
+        """The compiled `TemplatePlan` of the template, from the `registry`."""
+        from .registry import get_plan
+
+        return get_plan(self._template)
+
+    def _variables(self, plan):
+        return plan.variables(project=self._project_name, author=self._author, date=self.TODAY)
+
+    def _build_tree(self):
+        """
+        The project's tree: a `Directory`, or a `File` for a `pyscript`.
+        `create_project` writes the compiled plan directly instead.
+        """
+        plan = self._plan()
+        return plan.build(self._variables(plan))
 
-        return project_dir_path
-    
-    def _create_flaskapp_template(self):
+    def _create_project_dir(self, plan, variables:dict, operations:list):
         """
-        Creates a Flask App project.
+        Write the project of `plan` into the root dir and create its
+        virtualenv (unless the template or `create_venv` says otherwise).
+
+        The virtualenv is created on a background thread as soon as the
+        project root exists, so that it overlaps with writing the template
+        files. An error from either side is re-raised once both are done.
 
         Returns:
         --------
             `project_dir_path`: Path
         """
-        _proj_name = self._project_name.title().replace(' ', '')
-        project_dir = Directory(name=_proj_name)
-
-        # Add `app` directory
-        project_dir.add_directory(name='app')
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Add `app/main`
-        project_dir._content['app'].add_directory(name='main')
+        project_dir_path: Path = self._root_dir / plan.root_name(variables)
+        if not (plan.venv and self._create_venv):
+            self._write_files(plan, variables, operations)
+            return project_dir_path
 
-        # Add `app/main/routes.py`
-        project_dir._content['app']._content['main'].add_file(
-            name='routes.py',
-            content=ROUTES_PY % ('app/main/routes.py', self._author, self.TODAY, '.', 'main_bp')
-        )
+        project_dir_path.mkdir(parents=True)
 
-        # Add `app/main/__init__.py`
-        project_dir._content['app']._content['main'].add_file(
-            name='__init__.py',
-            content=ROUTE_INIT_PY % (
-                'app/main/__init__.py',
-                self._author,
-                self.TODAY,
-                'main',
-                'main',
-                'main'
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            venv_future = executor.submit(
+                self.create_virtualenv,
+                venv_path=project_dir_path / "env",
+                python_executable=sys.executable
             )
-        )
-
-        # Add 'app/api'
-        project_dir._content['app'].add_directory(name='api')
+            self._write_files(plan, variables, operations, root_exists=True)
+            venv_future.result()
 
-        # Add 'app/api/__init__.py'
-        project_dir._content['app']._content['api'].add_file(
-            name='__init__.py',
-            content=API_INIT_PY % (self._author, self.TODAY)
-        )
-
-        # Add 'app/api/v1'
-        project_dir._content['app']._content['api'].add_directory(name='v1')
-
-        # Add 'app/api/v1/__init__.py'
-        project_dir._content['app']._content['api']._content['v1'].add_file(
-            name='__init__.py',
-            content=API_V1_INIT_PY % (self._author, self.TODAY)
-        )
-
-        # Add 'app/api/v1/user_api.py'
-        project_dir._content['app']._content['api']._content['v1'].add_file(
-            name='user_api.py',
-            content=''
-        )
-
-        # Add 'app/auth'
-        project_dir._content['app'].add_directory(name='auth')
-
-        # Add `app/auth/routes.py`
-        project_dir._content['app']._content['auth'].add_file(
-            name='routes.py',
-            content=AUTH_ROUTES_PY % ('app/auth/routes.py', self._author, self.TODAY)
-        )
+        return project_dir_path
 
-        # Add 'app/auth/__init__.py'
-        project_dir._content['app']._content['auth'].add_file(
-            name='__init__.py',
-            content=ROUTE_INIT_PY % (
-                'app/auth/__init__.py',
-                self._author,
-                self.TODAY,
-                'auth',
-                'auth',
-                'auth'
+    def _write_files(self, plan, variables:dict, operations:list, root_exists:bool=False):
+        """`plan.execute` into the root dir, timed as `write_files`."""
+        with self._timings.phase("write_files") as phase:
+            phase.files, phase.bytes = plan.execute(
+                self._root_dir,
+                variables,
+                root_exists=root_exists,
+                durability=self._durability,
+                operations=operations
             )
-        )
-
-        # Add 'app/errors'
-        project_dir._content['app'].add_directory(name='errors')
-
-        # Add 'app/errors/__init__.py'
-        project_dir._content['app']._content['errors'].add_file(
-            name='__init__.py',
-            content=ERR_INIT_PY
-        )
-
-        # Add 'app/errors/handlers.py'
-        project_dir._content['app']._content['errors'].add_file(
-            name='handlers.py',
-            content=HANDLERS_PY % (self._author, self.TODAY)
-        )
-
-        # Add 'app/services'
-        project_dir._content['app'].add_directory(name='services')
-
-        # Add 'app/services/__init__.py'
-        project_dir._content['app']._content['services'].add_file(
-            name='__init__.py',
-            content=''
-        )
-
-        # Add 'app/utils'
-        project_dir._content['app'].add_directory(name='utils')
-
-        # Add 'app/utils/__init__.py'
-        project_dir._content['app']._content['utils'].add_file(
-            name='__init__.py',
-            content=''
-        )
-
-        # Add 'app/forms'
-        project_dir._content['app'].add_directory(name='forms')
-
-        # Add 'app/forms/__init__.py'
-        project_dir._content['app']._content['forms'].add_file(
-            name='__init__.py',
-            content=''
-        )
-
-        # Add 'app/static'
-        project_dir._content['app'].add_directory(
-            name='static'
-        )
-
-        # Add 'app/static/css
-        project_dir._content['app']._content['static'].add_directory(name='css')
-
-        # Add 'app/static/css/styles.css
-        project_dir._content['app']._content['static']._content['css'].add_file(
-            name='styles.css',
-            content=FLASK_STYLE_CSS
-        )
 
+    def create_virtualenv(self, venv_path:Path, python_executable:Path):
+        """
+        Create a virtualenv at `venv_path`.
 
-        # Add `app/static/img`
-        project_dir._content['app']._content['static'].add_directory(name="img")
-
-        # Add 'app/templates'
-        project_dir._content['app'].add_directory(name="templates")
-
-        # Add `app/templates/base.html`
-        _ext = (
-            r"<!-- %s"
-            + "\n"
-            + f"Author: {self._author}\nCreated On: {self.TODAY}\n"
-            + "-->"
-        ) 
-        project_dir._content['app']._content['templates'].add_file(
-            name="base.html",
-            content=_ext % "\napp/templates/base.html" + FLASK_BASE_HTML
-        )
-
-        # Add `app/templates/flash_msgs.html`
-        project_dir._content['app']._content['templates'].add_file(
-            name="flash_msgs.html",
-            content=_ext % '\napp/templates/flash_msgs.html' + FLASH_MSG_HTML
-        )
-
-        # Add `app/templates/index.html`
-        project_dir._content['app']._content['templates'].add_file(
-            name="index.html",
-            content=_ext % '\napp/templates/index.html' + FLASK_APP_INDEX_HTML
-        )
-
-        # Add `app/templates/emails`
-        project_dir._content['app']._content['templates'].add_directory(name="emails")
-
-        # Add `app/templates/errors`
-        project_dir._content['app']._content['templates'].add_directory(name="errors")
-
-        # Add `app/templates/emails/404.html`
-        project_dir._content['app']._content['templates']._content['errors'].add_file(
-            name='404.html',
-            content=ERR_404_HTML
-        )
-
-        # Add `app/templates/emails/400.html`
-        project_dir._content['app']._content['templates']._content['errors'].add_file(
-            name='400.html',
-            content=ERR_400_HTML
-        )
-
-        # Add `app/templates/emails/401.html`
-        project_dir._content['app']._content['templates']._content['errors'].add_file(
-            name='401.html',
-            content=ERR_401_HTML
-        )
-
-        # Add `app/templates/emails/403.html`
-        project_dir._content['app']._content['templates']._content['errors'].add_file(
-            name='403.html',
-            content=ERR_403_HTML
-        )
-
-        # Add `app/templates/emails/500.html`
-        project_dir._content['app']._content['templates']._content['errors'].add_file(
-            name='500.html',
-            content=ERR_500_HTML
-        )
-
-        # Add `app/templates/error_base.html`
-        project_dir._content['app']._content['templates'].add_file(
-            name='error_base.html',
-            content=ERR_BASE_HTML
-        )
-
-        # Add `app/templates/login.html`
-        project_dir._content['app']._content['templates'].add_file(
-            name='login.html',
-            content=_ext % '\napp/templates/login.html' + LOGIN_HTML
-        )
-
-        # Add `app/__init__.py`
-        _init_ext = (
-            f"# app/__init__.py\n# Webapp {_proj_name}\n"
-            + f"# Author: {self._author}\n# Created On: {self.TODAY}\n"
-        )
-        project_dir._content['app'].add_file(
-            name='__init__.py',
-            content=_init_ext + APP_INIT_PY
-        )
-
-        # Add `app/extensions.py`
-        _ext_ext = (
-            f"# app/extensions.py\n# Webapp {_proj_name}\n"
-            + f"# Author: {self._author}\n# Created On: {self.TODAY}\n"
-        )
-        project_dir._content['app'].add_file(
-            name='extensions.py',
-            content=_ext_ext + EXTENSIONS_PY
-        )
-
-        # Add .gitignore
-        project_dir.add_file(
-            name=".gitignore",
-            content=PY_GITIGNORE
-        )
-
-        # Name of the dev server filename
-        _dev_server_file = 'server.py'
-
-        # Add .env
-        project_dir.add_file(
-            name=".env",
-            content=DOT_ENV % _dev_server_file
-        )
-
-        # Add .env.example
-        project_dir.add_file(
-            name=".env.example",
-            content=DOT_ENV % _dev_server_file
-        )
-
-        # Add `server.py`
-        project_dir.add_file(
-            name=_dev_server_file,
-            content=SERVER_PY % (_proj_name, self._author, self.TODAY)
-        )
-
-        # Add `cli.py`
-        project_dir.add_file(
-            name="cli.py",
-            content=CLI_PY % (self._author, self.TODAY)
-        )
-
-        # Add `requirements.txt`
-        project_dir.add_file(
-            name="requirements.txt",
-            content=FLASK_REQU
-        )
-
-        # Add `config.py`
-        project_dir.add_file(
-            name="config.py",
-            content=FLASK_APP_CONFIG_PY % (self._author, self.TODAY)
-        )
-
-        # Add `README.md`
-        project_dir.add_file(
-            name="README.md",
-            content=README_MD
-        )
-
-        # Add `LICENSE`
-        project_dir.add_file(
-            name="LICENSE",
-            content=MIT_LICENSE
-        )
-
-        # Add `scripts` dir
-        project_dir.add_directory(name="scripts")
-
-        # Add `scripts/utils.py`
-        project_dir._content['scripts'].add_file(
-            name='utils.py',
-            content=SCRIPTS_UTILS_PY
-        )
+        Unless the seed cache is disabled, a pristine env is built once per
+        interpreter under `VENV_SEED_CACHE` and every new env is cloned from
+        it, which is much faster than running `virtualenv` each time.
+        """
+        import subprocess, shutil
 
+        try:
+            if self._use_venv_cache and os.name != 'nt':
+                try:
+                    seed_dir = self._get_venv_seed(python_executable)
+                    files, size, _ = self._seed_size(seed_dir)
+                    with self._timings.phase("venv_clone") as phase:
+                        self._clone_venv_seed(seed_dir, venv_path)
+                        phase.files, phase.bytes = files, size
+                    return
+                except OSError:
+                    # Unusable cache dir or a failed clone: build a fresh env.
+                    shutil.rmtree(venv_path, ignore_errors=True)
+
+            with self._timings.phase("venv_probe"):
+                subprocess.run(
+                    [python_executable, "-m", 'virtualenv', '--version'], 
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+            with self._timings.phase("venv_create") as phase:
+                subprocess.run(
+                    [python_executable, "-m", "virtualenv", str(venv_path)],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+                phase.files, phase.bytes, _ = self._tree_size(venv_path)
+        except subprocess.CalledProcessError:
+            print("\nERROR: `virtualenv` is not installed. Use following cmd to install:\n\t `python3 -m pip install virtualenv`\n")
 
-        # Create the project_dir
-        project_dir.create(path=self._root_dir)
-        project_dir_path: Path = self._root_dir / _proj_name
+    @staticmethod
+    def _venv_seed_key(python_executable:Path):
+        """Cache key made of the interpreter path and its version."""
+        import subprocess, hashlib
 
-        # Create venv
-        self.create_virtualenv(
-            venv_path=project_dir_path / "env",
-            python_executable=sys.executable
-        )
+        if str(python_executable) == sys.executable:
+            version = sys.version
+        else:
+            version = subprocess.run(
+                [python_executable, "-c", "import sys; print(sys.version)"],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True
+            ).stdout
+        key = f"{Path(python_executable).absolute()}\n{version.strip()}"
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    def _get_venv_seed(self, python_executable:Path):
+        """
+        Return the seed directory for `python_executable`, building it if needed.
 
-        return project_dir_path
+        A seed directory holds the pristine env in `env/` and, in `seed_path`,
+        the absolute path the env was originally built at (which is baked into
+        its activate scripts and shebangs).
+        """
+        import subprocess, shutil
+
+        with self._timings.phase("venv_seed"):
+            key = self._venv_seed_key(python_executable)
+            seed_dir = self.VENV_SEED_CACHE / key
+            if (seed_dir / "seed_path").is_file():
+                return seed_dir
+
+        # Build in a private dir and rename it into place, so that concurrent
+        # generators never see a half built seed.
+        tmp_dir = self.VENV_SEED_CACHE / f"{key}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        try:
+            with self._timings.phase("venv_probe"):
+                subprocess.run(
+                    [python_executable, "-m", 'virtualenv', '--version'], 
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+            with self._timings.phase("venv_create") as phase:
+                subprocess.run(
+                    [python_executable, "-m", "virtualenv", str(tmp_dir / "env")],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+                phase.files, phase.bytes, _ = self._tree_size(tmp_dir / "env")
+            (tmp_dir / "seed_path").write_text(str(tmp_dir / "env"))
+            os.rename(tmp_dir, seed_dir)
+        except OSError:
+            # Somebody else has just put a seed in place; use theirs.
+            if not (seed_dir / "seed_path").is_file():
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        return seed_dir
+
+    @staticmethod
+    def _tree_size(dir_path:Path):
+        """
+        `(files, bytes, directories)` below `dir_path`, where files are the
+        regular files and symlinks.
+        """
+        files = size = directories = 0
+        for root, dirs, names in os.walk(dir_path):
+            directories += len(dirs)
+            for name in names:
+                files += 1
+                size += os.lstat(os.path.join(root, name)).st_size
+        return files, size, directories
 
+    @classmethod
+    def _seed_size(cls, seed_dir:Path):
+        """`_tree_size` of a seed env, worked out once per seed and process."""
+        key = str(seed_dir)
+        if key not in cls._SEED_SIZES:
+            cls._SEED_SIZES[key] = cls._tree_size(Path(seed_dir) / "env")
+        return cls._SEED_SIZES[key]
+
+    @staticmethod
+    def _clone_venv_seed(seed_dir:Path, venv_path:Path):
+        """
+        Copy the seed env to `venv_path` and rewrite the seed's path in the
+        path-bearing files (activate scripts, console script shebangs and
+        `pyvenv.cfg`).
+        """
+        import subprocess, shutil
+
+        venv_path = Path(venv_path).absolute()
+        seed_env = seed_dir / "env"
+        old_prefix = (seed_dir / "seed_path").read_text().encode()
+
+        if sys.platform.startswith('linux') and shutil.which('cp'):
+            # `--reflink=auto` gives copy-on-write clones on btrfs/xfs and a
+            # plain copy everywhere else.
+            try:
+                subprocess.run(
+                    ["cp", "-a", "--reflink=auto", str(seed_env), str(venv_path)],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+            except subprocess.CalledProcessError as e:
+                raise OSError(e.stderr.decode(errors='replace').strip()) from e
+        else:
+            shutil.copytree(seed_env, venv_path, symlinks=True)
 
-    def create_virtualenv(self, venv_path:Path, python_executable:Path):
-        try:
-            subprocess.run(
-                [python_executable, "-m", 'virtualenv', '--version'], 
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
-            )
-            subprocess.run(
-                [python_executable, "-m", "virtualenv", str(venv_path)],
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
-            )
-        except subprocess.CalledProcessError:
-            print("\nERROR: `virtualenv` is not installed. Use following cmd to install:\n\t `python3 -m pip install virtualenv`\n")
+        new_prefix = str(venv_path).encode()
+        for file_path in [venv_path / "pyvenv.cfg", *(venv_path / "bin").iterdir()]:
+            if file_path.is_symlink() or not file_path.is_file():
+                continue
+            data = file_path.read_bytes()
+            if old_prefix in data and b"\0" not in data:
+                file_path.write_bytes(data.replace(old_prefix, new_prefix))
             
 
 if __name__ == "__main__":
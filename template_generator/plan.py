@@ -0,0 +1,100 @@
+# Dry-run write plans for `Directory.create` and `ProjectTemplate.create_project`
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+__all__ = [
+    "WritePlan"
+]
+
+
+class WritePlan:
+    """
+    Every path a `create` call would write, with the file sizes, worked out
+    without writing anything.
+
+    :param `entries`: `(path, size)` pairs in creation order; `size` is None
+                      for a directory.
+    :param `venv`: Estimated cost of the project's virtualenv, a dict with
+                   `files`, `directories` and `bytes` (all None if there is no
+                   venv seed to estimate from yet), or None if no virtualenv
+                   is created.
+
+    USAGE:
+        >>> plan = ProjectTemplate("my app", template="flaskapp").plan_project()
+        >>> plan.scaled(500)
+        {'copies': 500, 'files': ..., 'directories': ..., 'inodes': ..., 'bytes': ...}
+    """
+    def __init__(self, entries:list, venv:dict=None):
+        self._entries = entries
+        self._venv = venv
+        self._files = sum(1 for _, size in entries if size is not None)
+        self._bytes = sum(size for _, size in entries if size is not None)
+
+    @property
+    def entries(self):
+        return self._entries
+
+    @property
+    def venv(self):
+        return self._venv
+
+    @property
+    def files(self):
+        return self._files
+
+    @property
+    def directories(self):
+        return len(self._entries) - self._files
+
+    @property
+    def total_bytes(self):
+        """Bytes of the files, without the virtualenv."""
+        return self._bytes
+
+    @property
+    def venv_known(self):
+        """True unless a virtualenv is planned whose cost couldn't be estimated."""
+        return self._venv is None or self._venv["files"] is not None
+
+    def totals(self):
+        """Files, directories, inodes and bytes, virtualenv included."""
+        files, directories, size = self.files, self.directories, self.total_bytes
+        if self._venv is not None and self.venv_known:
+            files += self._venv["files"]
+            directories += self._venv["directories"]
+            size += self._venv["bytes"]
+        return {
+            "files": files,
+            "directories": directories,
+            "inodes": files + directories,
+            "bytes": size
+        }
+
+    def scaled(self, copies:int):
+        """`totals` for `copies` projects like this one."""
+        return {"copies": copies, **{k: v * copies for k, v in self.totals().items()}}
+
+    def as_dict(self, include_entries:bool=True):
+        plan = {"totals": self.totals(), "venv": self._venv}
+        if include_entries:
+            plan["entries"] = [
+                {"path": str(path), "size": size} for path, size in self._entries
+            ]
+        return plan
+
+    def report(self):
+        """The planned paths and the totals for the terminal."""
+        lines = [
+            f"{'' if size is None else size:>10}  {path}{'/' if size is None else ''}"
+            for path, size in self._entries
+        ]
+        totals = self.totals()
+        lines.append(
+            f"\n{totals['files']} files, {totals['directories']} directories "
+            f"({totals['inodes']} inodes), {totals['bytes']} bytes"
+        )
+        if not self.venv_known:
+            lines.append("(virtualenv not included: no venv seed to estimate it from yet)")
+        return "\n".join(lines)
@@ -0,0 +1,257 @@
+# The registry of project templates, built in and plugged in
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import os, sys
+from pathlib import Path
+
+__all__ = [
+    "TemplateRegistry",
+    "register_template",
+    "template_names",
+    "has_template",
+    "get_plan"
+]
+
+# Templates that come with the package: name -> module defining `SPEC`.
+BUILTIN_TEMPLATES = {
+    "pyscript": "template_generator.templates.pyscript",
+    "pyproject": "template_generator.templates.pyproject",
+    "flaskapp": "template_generator.templates.flaskapp",
+}
+
+# Entry point group of templates shipped by other packages, e.g. in their
+# `pyproject.toml`:
+#
+#   [project.entry-points."template_generator.templates"]
+#   django = "my_templates.django"          # a module defining `SPEC`
+#   fastapi = "my_templates.specs:FASTAPI"  # or any attribute of it
+ENTRY_POINT_GROUP = "template_generator.templates"
+
+# Directories of `<name>.json` spec files and `<name>.py` modules defining
+# `SPEC`, besides the ones in the `TEMPLATE_GENERATOR_PLUGINS` env var
+# (separated by `os.pathsep`).
+PLUGIN_DIRS = [Path.home() / ".config" / "template_generator" / "templates"]
+
+
+class TemplateRegistry:
+    """
+    Template names and where their specs come from (see
+    `template_generator.spec`). Only the names are known up front: a
+    template's module or spec file is loaded, and its plan compiled, the
+    first time that template is asked for, so any number of templates cost
+    nothing until they are used.
+
+    A source is one of:
+        - `"package.module"` or `"package.module:ATTR"`, a module imported
+          on first use and its `SPEC` (or `ATTR`);
+        - the `Path` of a `.json` spec file or of a `.py` module with `SPEC`;
+        - a spec dict.
+
+    Besides the built in and `register`ed templates, the registry finds
+    the ones in the plugin dirs and the entry points of the installed
+    packages the first time a name it doesn't know is looked up or the
+    names are listed. A name that is already taken is never replaced by a
+    discovered template.
+
+    :param `plugin_dirs`: Directories to look for template files in;
+                          default: `PLUGIN_DIRS` and `TEMPLATE_GENERATOR_PLUGINS`.
+    :param `entry_points`: Look for templates in the entry points too.
+
+    USAGE:
+        >>> registry = TemplateRegistry()
+        >>> registry.register("mylib", Path("specs/mylib.json"))
+        >>> registry.names()
+        ['pyscript', 'pyproject', 'flaskapp', 'mylib']
+        >>> registry.get_plan("mylib")
+    """
+    def __init__(self, plugin_dirs:list=None, entry_points:bool=True):
+        self._sources = dict(BUILTIN_TEMPLATES)
+        self._plans = {}
+        if plugin_dirs is None:
+            plugin_dirs = list(PLUGIN_DIRS) + [
+                Path(d) for d in os.environ.get("TEMPLATE_GENERATOR_PLUGINS", "").split(os.pathsep) if d
+            ]
+        self._plugin_dirs = plugin_dirs
+        self._entry_points = entry_points
+        self._discovered = False
+
+    def register(self, name:str, source):
+        """Register the template `name`, replacing any template of that name."""
+        self._sources[name] = source
+        self._plans.pop(name, None)
+
+    def names(self):
+        """Names of all the templates, the built in ones first."""
+        self._discover()
+        return list(self._sources)
+
+    def __contains__(self, name:str):
+        if name not in self._sources:
+            self._discover()
+        return name in self._sources
+
+    def load_spec(self, name:str):
+        """
+        The spec dict of the template `name`, read from its source. Raises
+        `SpecError` for an unknown name, and for a source that can't be
+        loaded, whatever went wrong in the plugin's code.
+        """
+        from .spec import SpecError, load_spec
+
+        if name not in self:
+            raise SpecError(f"Unknown template '{name}'.")
+        source = self._sources[name]
+        if isinstance(source, dict):
+            return source
+        try:
+            if isinstance(source, Path):
+                if source.suffix == ".json":
+                    return load_spec(source)
+                return _load_file_module(name, source).SPEC
+
+            from importlib import import_module
+
+            module_name, _, attr = source.partition(":")
+            return getattr(import_module(module_name), attr or "SPEC")
+        except SpecError:
+            raise
+        except Exception as e:
+            raise SpecError(f"Template '{name}': can't load `{source}`: {type(e).__name__}: {e}") from None
+
+    def get_plan(self, name:str):
+        """
+        The compiled `TemplatePlan` of the template `name`, compiled once.
+        Raises `SpecError` if the template is unknown or its spec is broken.
+        """
+        plan = self._plans.get(name)
+        if plan is None:
+            from .spec import SpecError, compile_spec
+
+            spec = self.load_spec(name)
+            try:
+                plan = compile_spec(spec)
+            except SpecError:
+                raise
+            except (TypeError, ValueError, AttributeError, KeyError) as e:
+                # A spec of the wrong shape, e.g. an entry that isn't a pair.
+                raise SpecError(f"Template '{name}': invalid spec: {type(e).__name__}: {e}") from None
+            self._plans[name] = plan
+        return plan
+
+    def _discover(self):
+        """Add the templates of the plugin dirs and the entry points, once."""
+        if self._discovered:
+            return
+        self._discovered = True
+
+        for plugin_dir in self._plugin_dirs:
+            try:
+                entries = sorted(os.scandir(plugin_dir), key=lambda entry: entry.name)
+            except OSError:
+                continue
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext in (".json", ".py") and not stem.startswith(("_", ".")) and entry.is_file():
+                    self._sources.setdefault(stem, Path(entry.path))
+
+        if self._entry_points:
+            for name, source in _entry_points(ENTRY_POINT_GROUP):
+                self._sources.setdefault(name, source)
+
+
+def _load_file_module(name:str, path:Path):
+    """Import the module file `path` of the plugin template `name`."""
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    module_name = f"template_generator_plugins.{name}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = module_from_spec(spec_from_file_location(module_name, path))
+        sys.modules[module_name] = module
+        try:
+            module.__spec__.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return module
+
+
+def _entry_points(group:str):
+    """
+    `(name, value)` of the entry points in `group` of the packages on
+    `sys.path`, read straight from the `entry_points.txt` of their
+    `.dist-info` or `.egg-info` directories, without importing
+    `importlib.metadata` (which takes longer than the rest of the startup
+    together).
+
+    Like `importlib.metadata`, a distribution found in several `sys.path`
+    entries counts once, from the first. Editable installs are found as
+    long as their metadata dir is in a `sys.path` entry (pip puts it in
+    site-packages; `setup.py develop` puts the `.egg-info` in the project
+    dir, which its `.egg-link`/`.pth` adds to `sys.path`). Not found:
+    eggs and wheels on `sys.path` as zip files, and metadata served by
+    custom `sys.meta_path` finders.
+    """
+    header = f"[{group}]"
+    found = []
+    seen = set()  # normalized names of the distributions read
+    for path in sys.path:
+        try:
+            entries = os.scandir(path or ".")
+        except OSError:
+            continue
+        with entries:
+            meta_dirs = [
+                entry.path for entry in entries
+                if entry.name.endswith((".dist-info", ".egg-info")) and entry.is_dir()
+            ]
+        for meta_dir in meta_dirs:
+            # "My_Pkg-1.0.dist-info" or "My_Pkg.egg-info" -> "my-pkg"
+            dist = os.path.splitext(os.path.basename(meta_dir))[0].partition("-")[0]
+            dist = dist.lower().replace("_", "-").replace(".", "-")
+            if dist in seen:
+                continue
+            seen.add(dist)
+            try:
+                with open(os.path.join(meta_dir, "entry_points.txt"), encoding="utf-8") as f:
+                    text = f.read()
+            except OSError:
+                continue
+            if header not in text:
+                continue
+            in_group = False
+            for line in text.splitlines():
+                line = line.strip()
+                if line.startswith("["):
+                    in_group = line == header
+                elif in_group and "=" in line and not line.startswith(("#", ";")):
+                    name, _, value = line.partition("=")
+                    # Drop the extras of `module:attr [extra]`.
+                    found.append((name.strip(), value.partition("[")[0].strip()))
+    return found
+
+
+# The registry `ProjectTemplate`, `main.py` and the batch runs use.
+_REGISTRY = TemplateRegistry()
+
+
+def register_template(name:str, source):
+    """Register the template `name` from `source` (see `TemplateRegistry`)."""
+    _REGISTRY.register(name, source)
+
+
+def template_names():
+    """Names of all the templates that can be created."""
+    return _REGISTRY.names()
+
+
+def has_template(name:str):
+    return name in _REGISTRY
+
+
+def get_plan(name:str):
+    """The compiled `TemplatePlan` of the template `name`, compiled once per process."""
+    return _REGISTRY.get_plan(name)
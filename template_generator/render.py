@@ -0,0 +1,198 @@
+# A small template engine for the file bodies in `constants.py`
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import re, threading
+from collections import OrderedDict
+from functools import lru_cache
+from . import constants
+
+__all__ = [
+    "Template",
+    "TemplateError",
+    "RenderCache",
+    "RENDER_CACHE",
+    "get_template",
+    "render"
+]
+
+# `%(name)s` is a variable and `%%` a literal `%`; any other `%` (CSS
+# percentages, Jinja's `{% ... %}`) is left alone.
+_PLACEHOLDER = re.compile(r"%\((\w+)\)s|%%")
+
+
+class TemplateError(ValueError):
+    """Raised when a template is rendered with missing or unknown variables."""
+
+
+class Template:
+    """
+    A template compiled once into a list of segments: literal text with the
+    variables' slots in between.
+
+    :param `source`: Template text with `%(name)s` placeholders.
+    :param `name`: Name used in error messages.
+
+    USAGE:
+        >>> tpl = Template("# %(path)s\n# Author: %(author)s\n")
+        >>> tpl.render(path="app/main.py", author="Indrajit Ghosh")
+    """
+    def __init__(self, source:str, name:str=None):
+        self._name = name if name else "<template>"
+
+        parts = []  # literal text, with None where a variable goes
+        slots = []  # (index into `parts`, variable name)
+        last = 0
+        for match in _PLACEHOLDER.finditer(source):
+            literal = source[last:match.start()]
+            if match.group(1) is None:
+                literal += '%'
+            if literal:
+                parts.append(literal)
+            if match.group(1) is not None:
+                slots.append((len(parts), match.group(1)))
+                parts.append(None)
+            last = match.end()
+        if last < len(source):
+            parts.append(source[last:])
+
+        self._parts = parts
+        self._slots = tuple(slots)
+        self._variables = frozenset(var for _, var in slots)
+        # The order of the variables' values in a `RenderCache` key.
+        self._key_order = tuple(sorted(self._variables))
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def variables(self):
+        """Names of the variables the template needs."""
+        return self._variables
+
+    def check(self, variables:dict):
+        """Raise `TemplateError` unless `variables` has exactly the needed names."""
+        missing = self._variables.difference(variables)
+        unknown = set(variables).difference(self._variables)
+        if missing or unknown:
+            problems = []
+            if missing:
+                problems.append(f"missing {sorted(missing)}")
+            if unknown:
+                problems.append(f"unknown {sorted(unknown)}")
+            raise TemplateError(f"Template `{self._name}`: " + ", ".join(problems) + ".")
+
+    def render(self, **variables):
+        if variables.keys() != self._variables:
+            self.check(variables)
+        parts = self._parts.copy()
+        for index, var in self._slots:
+            value = variables[var]
+            parts[index] = value if type(value) is str else str(value)
+        return "".join(parts)
+
+
+class RenderCache:
+    """
+    Rendered templates, utf-8 encoded and ready to be written, keyed by the
+    template and its variables' values; the least recently used renders are
+    dropped once there are `maxsize` of them.
+
+    Projects generated with the same author and date share most of their
+    rendered bodies, so over a batch run each distinct body is rendered and
+    encoded once and then only looked up.
+
+    Safe to share between threads: the lookups, inserts and counts are made
+    under a lock, while the rendering itself runs outside of it.
+
+    :param `maxsize`: Number of renders kept.
+
+    USAGE:
+        >>> cache = RenderCache(maxsize=256)
+        >>> cache.render(get_template("HTML_HEADER"), path="base.html", author="Indrajit Ghosh", date="Oct 18, 2026")
+        b'<!-- ...'
+        >>> cache.info()
+        {'hits': 0, 'misses': 1, 'size': 1, 'maxsize': 256}
+    """
+    def __init__(self, maxsize:int=1024):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be at least 1.")
+        self._maxsize = maxsize
+        self._renders = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._renders)
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def get(self, key):
+        """The render cached under `key`, or None."""
+        with self._lock:
+            try:
+                data = self._renders.get(key)
+            except TypeError:
+                data = None # An unhashable value: nothing to look up by.
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._renders.move_to_end(key)
+            return data
+
+    def put(self, key, data:bytes):
+        """Cache `data` under `key`, dropping the least recently used render if full."""
+        with self._lock:
+            try:
+                self._renders[key] = data
+            except TypeError:
+                return data
+            if len(self._renders) > self._maxsize:
+                self._renders.popitem(last=False)
+            return data
+
+    def render(self, template:Template, **variables):
+        """`template.render(**variables)`, encoded as utf-8."""
+        if variables.keys() != template.variables:
+            template.check(variables)
+        key = (template, tuple([variables[var] for var in template._key_order]))
+        data = self.get(key)
+        if data is None:
+            data = self.put(key, template.render(**variables).encode())
+        return data
+
+    def info(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._renders), "maxsize": self._maxsize}
+
+    def clear(self):
+        """Drop the renders and reset the counts."""
+        with self._lock:
+            self._renders.clear()
+            self.hits = self.misses = 0
+
+
+# The cache the compiled template plans render through (see `spec.py`).
+RENDER_CACHE = RenderCache()
+
+
+@lru_cache(maxsize=None)
+def get_template(name:str):
+    """Return the compiled form of the constant `name` of `constants.py`."""
+    try:
+        source = getattr(constants, name)
+    except AttributeError:
+        raise TemplateError(f"Unknown template `{name}`.") from None
+    return Template(source, name=name)
+
+
+def render(name:str, /, **variables):
+    """Render the constant `name` of `constants.py` with `variables`."""
+    return get_template(name).render(**variables)
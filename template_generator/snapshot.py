@@ -0,0 +1,176 @@
+# A compact single-file format for `Directory` trees
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import hashlib, mmap, os, struct
+from pathlib import Path
+from .model import File, Directory
+
+__all__ = [
+    "save_directory",
+    "load_directory"
+]
+
+# Layout of a snapshot file (all integers little-endian):
+#
+#   header       HEADER
+#   node table   node_count x NODE, in pre-order (node 0 is the root)
+#   name table   the utf-8 names of all nodes, back to back
+#   blob table   blob_count x BLOB: (offset into the blob section, length)
+#   blob section the distinct file contents, back to back
+#
+MAGIC = b"TGSNAP\x00\x01"
+HEADER = struct.Struct("<8sIIIQQ")  # magic, node_count, blob_count, names_size, blob_section_offset, blob_section_size
+NODE = struct.Struct("<iIIiBB")     # parent, name_offset, name_len, blob (-1: none), kind, flags
+BLOB = struct.Struct("<QQ")         # offset, length
+
+KIND_DIR = 0
+KIND_FILE = 1
+
+FLAG_TEXT = 1  # The content was text (`File.content`) rather than bytes.
+
+# What can't be part of a node's name: it would point `create` elsewhere.
+_PATH_SEPARATORS = {"/", "\0", os.sep, os.altsep} - {None}
+
+
+def _file_data(file:File):
+    """Return `(data, is_text)` for what `file.create` would write."""
+    if type(file._content) is memoryview:
+        return bytes(file._content), True # Text from a loaded snapshot
+    binary_content = file.binary_content
+    if binary_content:
+        return bytes(binary_content), False
+    if file.content:
+        return file.content.encode(), True
+    return b"", False
+
+
+def save_directory(directory:Directory, path:Path):
+    """
+    Write `directory` with everything in it to the snapshot file `path`.
+    Identical file contents are stored only once.
+    """
+    nodes = []
+    names = bytearray()
+    blobs = []
+    blob_index = {}  # digest -> index into `blobs`
+
+    stack = [(-1, directory._name, directory)]
+    while stack:
+        parent, name, entry = stack.pop()
+        index = len(nodes)
+        encoded_name = name.encode()
+        name_offset = len(names)
+        names += encoded_name
+
+        if isinstance(entry, Directory):
+            nodes.append((parent, name_offset, len(encoded_name), -1, KIND_DIR, 0))
+            stack.extend(
+                (index, child_name, child)
+                for child_name, child in reversed(entry._content.items())
+            )
+        else:
+            data, is_text = _file_data(entry)
+            digest = entry.blob_id or hashlib.sha256(data).digest()
+            if digest not in blob_index:
+                blob_index[digest] = len(blobs)
+                blobs.append(data)
+            nodes.append((
+                parent, name_offset, len(encoded_name), blob_index[digest],
+                KIND_FILE, FLAG_TEXT if is_text else 0
+            ))
+
+    blob_table = bytearray()
+    offset = 0
+    for data in blobs:
+        blob_table += BLOB.pack(offset, len(data))
+        offset += len(data)
+
+    blob_section_offset = (
+        HEADER.size + NODE.size * len(nodes) + len(names) + len(blob_table)
+    )
+    with Path(path).open("wb") as f:
+        f.write(HEADER.pack(MAGIC, len(nodes), len(blobs), len(names), blob_section_offset, offset))
+        for node in nodes:
+            f.write(NODE.pack(*node))
+        f.write(names)
+        f.write(blob_table)
+        for data in blobs:
+            f.write(data)
+
+
+def load_directory(path:Path):
+    """
+    Read a snapshot file written by `save_directory`.
+
+    The file is memory-mapped, and file contents are zero-copy slices of the
+    map: a content is only paged in when it is written out (or asked for
+    through `File.binary_content`, or `File.content` which decodes it then).
+    A file that isn't a well formed snapshot raises a `ValueError`.
+    """
+    with Path(path).open("rb") as f:
+        snapshot = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(snapshot)
+    if len(view) < HEADER.size:
+        raise ValueError(f"{path} is not a directory snapshot.")
+    magic, node_count, blob_count, names_size, blob_section_offset, blob_section_size = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a directory snapshot.")
+
+    names_offset = HEADER.size + NODE.size * node_count
+    blob_table_offset = names_offset + names_size
+    if (
+        node_count == 0
+        or blob_table_offset + BLOB.size * blob_count > blob_section_offset
+        or blob_section_offset + blob_section_size > len(view)
+    ):
+        raise ValueError(f"{path}: truncated or corrupt snapshot.")
+    blob_spans = [
+        BLOB.unpack_from(view, blob_table_offset + i * BLOB.size)
+        for i in range(blob_count)
+    ]
+    if any(offset + length > blob_section_size for offset, length in blob_spans):
+        raise ValueError(f"{path}: truncated or corrupt snapshot.")
+
+    entries = []
+    for i in range(node_count):
+        parent, name_offset, name_len, blob, kind, flags = NODE.unpack_from(
+            view, HEADER.size + i * NODE.size
+        )
+        if name_offset + name_len > names_size:
+            raise ValueError(f"{path}: invalid name for node {i}.")
+        start = names_offset + name_offset
+        name = str(view[start:start + name_len], "utf-8")
+        # A crafted or corrupt snapshot must not make `create` write outside
+        # the directory it is given.
+        if name in ("", ".", "..") or any(sep in name for sep in _PATH_SEPARATORS):
+            raise ValueError(f"{path}: invalid name {name!r} for node {i}.")
+        if i == 0 and parent != -1:
+            raise ValueError(f"{path}: the root node has parent {parent}.")
+        if i and not (0 <= parent < i and isinstance(entries[parent], Directory)):
+            raise ValueError(f"{path}: invalid parent {parent} for node {i}.")
+
+        if kind == KIND_DIR:
+            entry = Directory(name=name)
+        elif kind == KIND_FILE:
+            if not 0 <= blob < blob_count:
+                raise ValueError(f"{path}: invalid content {blob} for node {i}.")
+            offset, length = blob_spans[blob]
+            start = blob_section_offset + offset
+            data = view[start:start + length]
+            if flags & FLAG_TEXT:
+                # Kept encoded too: `File.content` decodes it when asked for.
+                entry = File(content=data, name=name)
+            else:
+                entry = File(binary_content=data, name=name)
+        else:
+            raise ValueError(f"{path}: invalid kind {kind} for node {i}.")
+
+        if parent >= 0:
+            entries[parent]._content[name] = entry
+        entries.append(entry)
+
+    return entries[0]
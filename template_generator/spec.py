@@ -0,0 +1,346 @@
+# Declarative project template specs and the write plans they compile to
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import os
+from pathlib import Path
+from . import constants
+from .render import Template, RENDER_CACHE, get_template
+from .model import File, Directory, _fsync_path, _sync_tree
+
+__all__ = [
+    "SpecError",
+    "TemplatePlan",
+    "compile_spec",
+    "load_spec"
+]
+
+# A spec is a dict (or the same thing as JSON):
+#
+#   {
+#       "name": "pyproject",
+#       "root": "%(dir_name)s",   # the project dir; null: write into the root dir
+#       "venv": true,             # create a virtualenv in the project dir
+#       "names": {                # variables made from `project`, in order
+#           "project_name": ["project", ["title_words", "_"]],
+#           "module_name": ["project_name", ["lower"]]
+#       },
+#       "entries": [              # [path, content], in creation order
+#           ["%(module_name)s/__init__.py", {"template": "PYPROJ_INIT_PY"}],
+#           [".gitignore", {"constant": "PY_GITIGNORE"}],
+#           ["setup.py", ""],
+#           ["docs/", null]
+#       ],
+#       "run": ["env/bin/python main.py"]  # optional, shown after creation
+#   }
+#
+# Every spec has the variables `project` (the name as given), `author` and
+# `date`, plus its `names`. A name is a source variable and the operations
+# applied to it in turn: ["lower"], ["title"], ["replace", old, new] or
+# ["title_words", sep] (every space separated word title-cased, joined by
+# `sep`). Paths may use variables as `%(name)s`; the directories on the way
+# to an entry are created automatically.
+#
+# A content is a directory (null, or a path ending with "/"), a literal
+# string, or one of these parts, or a list of them to concatenate:
+#
+#   {"constant": NAME}             the body NAME of `constants`, as is
+#   {"template": NAME, "vars": {}} the body NAME rendered with the spec's
+#                                  variables, `vars` adding or overriding some
+#   {"format": "# %(path)s"}       inline template text, rendered the same way
+
+_NAME_OPERATIONS = {
+    "lower": lambda value: value.lower(),
+    "title": lambda value: value.title(),
+    "replace": lambda value, old, new: value.replace(old, new),
+    "title_words": lambda value, sep: sep.join(word.title() for word in value.split(' ')),
+}
+
+
+class SpecError(ValueError):
+    """Raised for a template spec that can't be compiled."""
+
+
+class TemplatePlan:
+    """
+    A template spec compiled into the ordered mkdir and write operations of
+    a project, with everything that doesn't depend on the variables already
+    rendered. Plans are immutable and shared: see `registry.get_plan`.
+
+    USAGE:
+        >>> plan = get_plan("flaskapp")  # from template_generator.registry
+        >>> variables = plan.variables(project="my app", author="Indrajit Ghosh", date="Oct 18, 2026")
+        >>> plan.execute("/tmp", variables)
+    """
+    __slots__ = ("_name", "_root", "_names", "_operations", "_venv", "_run")
+
+    def __init__(self, name:str, root, names:tuple, operations:tuple, venv:bool, run:tuple):
+        self._name = name
+        self._root = root
+        self._names = names
+        self._operations = operations
+        self._venv = venv
+        self._run = run
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def venv(self):
+        """True if the project gets a virtualenv."""
+        return self._venv
+
+    @property
+    def run_commands(self):
+        """Commands that run the generated project, shown after creation."""
+        return self._run
+
+    def variables(self, project:str, author:str, date:str):
+        """The variables of a project named `project`, its `names` included."""
+        variables = {"project": project, "author": author, "date": date}
+        for name, source, operations in self._names:
+            value = variables[source]
+            for operation, args in operations:
+                value = operation(value, *args)
+            variables[name] = value
+        return variables
+
+    def root_name(self, variables:dict):
+        """Name of the project dir, or None if the files go straight into the root dir."""
+        return None if self._root is None else _fill(self._root, variables)
+
+    def render(self, variables:dict, cache=RENDER_CACHE):
+        """
+        Fill in `variables`: a list of `(relative_path, data)` in creation
+        order, where `data` is the utf-8 encoded file body, or None for a
+        directory. The variable parts are rendered through the `RenderCache`
+        `cache`, so a body that has been rendered before is only looked up.
+        """
+        operations = []
+        for path, parts in self._operations:
+            if parts is None:
+                data = None
+            elif len(parts) == 1:
+                part = parts[0]
+                data = part if type(part) is bytes else _fill_bytes(part, variables, cache)
+            else:
+                data = b"".join([
+                    part if type(part) is bytes else _fill_bytes(part, variables, cache)
+                    for part in parts
+                ])
+            operations.append((_fill(path, variables), data))
+        return operations
+
+    def execute(self, base_dir, variables:dict, root_exists:bool=False, durability:str="none", operations:list=None):
+        """
+        Create the project in `base_dir`.
+
+        :param `root_exists`: The project dir has been made already.
+        :param `durability`: As for `Directory.create`.
+        :param `operations`: The output of `render(variables)`, if already at hand.
+        :return: `(files, bytes)` written.
+        """
+        if durability not in Directory.DURABILITY:
+            raise ValueError(
+                f"Unknown durability '{durability}', expected one of {Directory.DURABILITY}."
+            )
+        if operations is None:
+            operations = self.render(variables)
+
+        base_dir = os.fspath(base_dir)
+        root = self.root_name(variables)
+        if root is None:
+            project_dir = base_dir
+        else:
+            project_dir = os.path.join(base_dir, root)
+            if not root_exists:
+                os.makedirs(project_dir)
+
+        fsync_files = durability == "strict"
+        dirs = [base_dir] if root is None else [base_dir, project_dir]
+        written = []
+        files = size = 0
+        for path, data in operations:
+            path = os.path.join(project_dir, path)
+            if data is None:
+                os.mkdir(path)
+                dirs.append(path)
+            else:
+                with open(path, "wb") as f:
+                    f.write(data)
+                if fsync_files:
+                    _fsync_path(path)
+                elif durability == "batched":
+                    written.append(path)
+                files += 1
+                size += len(data)
+
+        if durability != "none":
+            _sync_tree(written, dirs)
+        return files, size
+
+    def build(self, variables:dict):
+        """The project as a `Directory`, or as a `File` if the spec has no root."""
+        operations = self.render(variables)
+        root = self.root_name(variables)
+        if root is None:
+            if len(operations) != 1 or operations[0][1] is None:
+                raise SpecError(f"Spec `{self._name}`: without a root it must be a single file.")
+            path, data = operations[0]
+            return File(content=data.decode(), name=path)
+
+        project_dir = Directory(name=root)
+        project_dir.bulk_insert(
+            (path, Directory() if data is None else data.decode()) for path, data in operations
+        )
+        return project_dir
+
+
+def _fill(part, variables:dict):
+    """A compiled path or content part, with `variables` filled in."""
+    if type(part) is str:
+        return part
+    template, fixed, names = part
+    return template.render(**fixed, **{name: variables[name] for name in names})
+
+
+def _fill_bytes(part, variables:dict, cache):
+    """
+    A compiled variable content part, with `variables` filled in and
+    encoded, from `cache` if it has been rendered with the same values
+    before.
+    """
+    template, fixed, names, key = part
+    key = (key, *[variables[name] for name in names])
+    data = cache.get(key)
+    if data is None:
+        data = cache.put(key, template.render(**fixed, **{name: variables[name] for name in names}).encode())
+    return data
+
+
+def _compile_text(source:str, spec_name:str, known:set, template:Template=None, fixed:dict=None):
+    """
+    Compile template text into a static `str`, or into `(template, fixed
+    variables, names of the spec variables it needs)`.
+    """
+    template = template if template is not None else Template(source, name=repr(source))
+    fixed = dict(fixed or {})
+    extra = fixed.keys() - template.variables
+    if extra:
+        raise SpecError(f"Spec `{spec_name}`: {template.name} has no variable(s) {sorted(extra)}.")
+    needed = template.variables - fixed.keys()
+    unknown = needed - known
+    if unknown:
+        raise SpecError(f"Spec `{spec_name}`: {template.name} needs unknown variable(s) {sorted(unknown)}.")
+    if not needed:
+        return template.render(**fixed)
+    return (template, fixed, tuple(sorted(needed)))
+
+
+def _compile_content(content, spec_name:str, known:set):
+    """
+    Compile an entry's content into a tuple of parts: the static ones
+    already encoded, the rest as for `_fill_bytes`.
+    """
+    parts = []
+    for item in (content if isinstance(content, list) else [content]):
+        if isinstance(item, str):
+            parts.append(item)
+        elif isinstance(item, dict) and "constant" in item:
+            try:
+                parts.append(getattr(constants, item["constant"]))
+            except AttributeError:
+                raise SpecError(f"Spec `{spec_name}`: unknown constant `{item['constant']}`.") from None
+        elif isinstance(item, dict) and "template" in item:
+            try:
+                template = get_template(item["template"])
+            except ValueError as e:
+                raise SpecError(f"Spec `{spec_name}`: {e}") from None
+            parts.append(_compile_text(None, spec_name, known, template, item.get("vars")))
+        elif isinstance(item, dict) and "format" in item:
+            parts.append(_compile_text(item["format"], spec_name, known, fixed=item.get("vars")))
+        else:
+            raise SpecError(f"Spec `{spec_name}`: invalid content {item!r}.")
+
+    # Join the neighbouring static parts.
+    merged = []
+    for part in parts:
+        if type(part) is str and merged and type(merged[-1]) is str:
+            merged[-1] += part
+        else:
+            merged.append(part)
+    return tuple(
+        # The variable parts also get their `RenderCache` key: the template
+        # and the fixed variables, which the values of `names` complete.
+        part.encode() if type(part) is str else (*part, (part[0], tuple(sorted(part[1].items()))))
+        for part in merged
+    )
+
+
+def compile_spec(spec:dict):
+    """Compile the template spec `spec` (see the top of this module) into a `TemplatePlan`."""
+    try:
+        spec_name = spec["name"]
+        entries = spec["entries"]
+    except (KeyError, TypeError):
+        raise SpecError("A spec needs a `name` and a list of `entries`.") from None
+
+    known = {"project", "author", "date"}
+    names = []
+    for name, (source, *operations) in spec.get("names", {}).items():
+        if source not in known:
+            raise SpecError(f"Spec `{spec_name}`: name `{name}` is made from unknown variable `{source}`.")
+        compiled = []
+        for operation, *args in operations:
+            if operation not in _NAME_OPERATIONS:
+                raise SpecError(f"Spec `{spec_name}`: unknown name operation `{operation}`.")
+            compiled.append((_NAME_OPERATIONS[operation], tuple(args)))
+        names.append((name, source, tuple(compiled)))
+        known.add(name)
+
+    root = spec.get("root")
+    if root is not None:
+        root = _compile_text(root, spec_name, known)
+
+    operations = []
+    directories = set()
+    for path, content in entries:
+        is_dir = content is None or path.endswith("/")
+        parts = [part for part in path.split("/") if part and part != "."]
+        if not parts or ".." in parts:
+            raise SpecError(f"Spec `{spec_name}`: invalid entry path '{path}'.")
+        # The directories on the way, each made once, before their contents.
+        for depth in range(1, len(parts) + (1 if is_dir else 0)):
+            directory = "/".join(parts[:depth])
+            if directory not in directories:
+                directories.add(directory)
+                operations.append((_compile_text(os.path.join(*parts[:depth]), spec_name, known), None))
+        if not is_dir:
+            operations.append((
+                _compile_text(os.path.join(*parts), spec_name, known),
+                _compile_content(content, spec_name, known)
+            ))
+
+    return TemplatePlan(
+        name=spec_name,
+        root=root,
+        names=tuple(names),
+        operations=tuple(operations),
+        venv=bool(spec.get("venv", root is not None)),
+        run=tuple(spec.get("run", ()))
+    )
+
+
+def load_spec(path:Path):
+    """Read a template spec from the JSON file `path`."""
+    import json
+
+    with open(path) as f:
+        try:
+            return json.load(f)
+        except ValueError as e:
+            raise SpecError(f"{path}: {e}") from None
+
@@ -0,0 +1,4 @@
+# template_generator/templates/__init__.py
+#
+# The bodies of the generated files, one module per project template.
+# They are imported on first use through `template_generator.constants`.
@@ -0,0 +1,65 @@
+# Template bodies of the `pyproject` template
+#
+# Author: Indrajit Ghosh
+#
+
+MAIN_PY = r"""# %(project_name)s - Description
+#
+# Author: %(author)s
+# Created on: %(date)s
+#
+
+from %(module_name)s import *
+
+def main():
+    print("Hello World!")
+
+
+if __name__ == '__main__':
+    main()
+"""
+
+
+REQUIREMENTS = """
+# Write down the modules you need to install and then
+# run the cmd: ```pip install -r requirements.txt```
+"""
+
+
+PYPROJ_INIT_PY = r'''# %(project_name)s/__init__.py
+
+# Import statements
+from .model import *
+
+# Package-level variables
+version = "1.0"
+'''
+
+
+MODEL_PY = r"""# %(project_name)s/model.py
+#
+# Author: %(author)s
+# Created on: %(date)s
+#
+"""
+
+# The `pyproject` template (see `template_generator.spec`).
+SPEC = {
+    "name": "pyproject",
+    "root": "%(dir_name)s",
+    "venv": True,
+    "names": {
+        "project_name": ["project", ["title_words", "_"]],
+        "module_name": ["project_name", ["lower"]],
+        "dir_name": ["project_name", ["replace", "_", ""]],
+    },
+    "entries": [
+        ["%(module_name)s/__init__.py", {"template": "PYPROJ_INIT_PY"}],
+        ["%(module_name)s/model.py", {"template": "MODEL_PY"}],
+        [".gitignore", {"constant": "PY_GITIGNORE"}],
+        ["main.py", {"template": "MAIN_PY"}],
+        ["requirements.txt", {"constant": "REQUIREMENTS"}],
+        ["README.md", {"constant": "README_MD"}],
+        ["setup.py", ""],
+    ],
+}
@@ -0,0 +1,25 @@
+# Template bodies of the `pyscript` template
+#
+# Author: Indrajit Ghosh
+#
+
+SCRIPT_MAIN_PY = r"""# %(script_name)s - Description
+#
+# Author: %(author)s
+# Created on: %(date)s
+#
+"""
+
+# The `pyscript` template: a single script named after the project, written
+# straight into the root dir (see `template_generator.spec`).
+SPEC = {
+    "name": "pyscript",
+    "root": None,
+    "venv": False,
+    "names": {
+        "script_name": ["project", ["lower"], ["replace", " ", "_"]],
+    },
+    "entries": [
+        ["%(script_name)s.py", {"template": "SCRIPT_MAIN_PY"}],
+    ],
+}
@@ -0,0 +1,117 @@
+# Per-phase timings of `ProjectTemplate.create_project`
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import threading, time
+from contextlib import contextmanager
+
+__all__ = [
+    "Phase",
+    "PhaseTimings"
+]
+
+
+class Phase:
+    """
+    One timed phase: its wall time and how many files and bytes it wrote.
+
+    :param `name`: Name of the phase, e.g. `build_tree` or `venv_clone`.
+    :param `start`: Start of the phase, in seconds since the timings began.
+    """
+    def __init__(self, name:str, start:float):
+        self.name = name
+        self.start = start
+        self.seconds = None
+        self.files = 0
+        self.bytes = 0
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "start": round(self.start, 6),
+            "seconds": round(self.seconds, 6),
+            "files": self.files,
+            "bytes": self.bytes
+        }
+
+    def __repr__(self):
+        return f"Phase({self.name!r}, seconds={self.seconds}, files={self.files}, bytes={self.bytes})"
+
+
+class PhaseTimings:
+    """
+    Wall time, files written and bytes written of every phase of a
+    `create_project` call.
+
+    Phases may run concurrently (the virtualenv is created while the
+    template files are written), so each one also records when it started.
+
+    :param `callback`: Called with every `Phase` as soon as it has finished.
+
+    USAGE:
+        >>> proj = ProjectTemplate("my project", template="flaskapp")
+        >>> proj.create_project()
+        >>> print(proj.timings.report())
+        >>> proj.timings.to_json("timings.json")
+    """
+    def __init__(self, callback=None):
+        self._callback = callback
+        self._phases = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    @property
+    def phases(self):
+        """The finished phases, in the order they finished."""
+        return list(self._phases)
+
+    @contextmanager
+    def phase(self, name:str):
+        """
+        Time the body of the `with` statement as the phase `name`; the body
+        may set `files` and `bytes` on the yielded `Phase`.
+        """
+        start = time.perf_counter()
+        phase = Phase(name, start - self._origin)
+        try:
+            yield phase
+        finally:
+            phase.seconds = time.perf_counter() - start
+            with self._lock:
+                self._phases.append(phase)
+            if self._callback is not None:
+                self._callback(phase)
+
+    @property
+    def total_seconds(self):
+        """Wall time from the start of the timings to the end of the last phase."""
+        return max((p.start + p.seconds for p in self._phases), default=0.0)
+
+    def as_dict(self):
+        return {
+            "total_seconds": round(self.total_seconds, 6),
+            "phases": [p.as_dict() for p in self._phases]
+        }
+
+    def to_json(self, path=None):
+        """Return the timings as a JSON string, and write them to `path` if given."""
+        import json
+
+        text = json.dumps(self.as_dict(), indent=4)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+        return text
+
+    def report(self):
+        """A table of the phases for the terminal."""
+        lines = [f"{'phase':<16}{'start':>10}{'time':>10}{'files':>8}{'bytes':>12}"]
+        for p in self._phases:
+            lines.append(
+                f"{p.name:<16}{p.start * 1000:>8.1f}ms{p.seconds * 1000:>8.1f}ms"
+                f"{p.files:>8}{p.bytes:>12}"
+            )
+        lines.append(f"{'total':<16}{'':>10}{self.total_seconds * 1000:>8.1f}ms")
+        return "\n".join(lines)
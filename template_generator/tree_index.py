@@ -0,0 +1,90 @@
+# A persistent index of directory listings for fast repeated tree scans
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import json, os, threading, time
+from pathlib import Path
+from .model import Directory
+
+__all__ = [
+    "TreeIndex"
+]
+
+
+class TreeIndex:
+    """
+    An on-disk cache of directory listings keyed by each directory's mtime.
+
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed in it, so a listing whose mtime still matches can be reused
+    without reading the directory again. Pass an instance to
+    `Directory.get_tree_from_path(..., index=...)` and call `save` when done.
+
+    :param `index_path`: The cache file (default: `DEFAULT_PATH`).
+    """
+    DEFAULT_PATH:Path = Path.home() / ".cache" / "template_generator" / "tree_index.json"
+
+    # Listings of directories changed this recently (in ns) are not cached:
+    # another change within the same mtime tick would go unnoticed.
+    RACY_WINDOW_NS = 2 * 10**9
+
+    def __init__(self, index_path:Path=None):
+        self._index_path = Path(index_path) if index_path else self.DEFAULT_PATH
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        # abs dir path -> [mtime_ns, [[name, is_file, is_dir], ...]]
+        try:
+            with self._index_path.open() as f:
+                self._listings = json.load(f)
+        except (OSError, ValueError):
+            self._listings = {}
+
+    @property
+    def index_path(self):
+        return self._index_path
+
+    def scan_dir(self, dir_path):
+        """
+        List `dir_path` as `(name, path, is_file, is_dir)` tuples, like
+        `Directory._scan_dir`, reusing the cached listing if the directory
+        has not changed since it was recorded.
+        """
+        key = os.path.abspath(dir_path)
+        mtime_ns = os.stat(dir_path).st_mtime_ns
+
+        cached = self._listings.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            with self._lock:
+                self.hits += 1
+            return [
+                (name, os.path.join(dir_path, name), is_file, is_dir)
+                for name, is_file, is_dir in cached[1]
+            ]
+
+        contents = Directory._scan_dir(dir_path)
+        with self._lock:
+            self.misses += 1
+            if time.time_ns() - mtime_ns > self.RACY_WINDOW_NS:
+                self._listings[key] = [
+                    mtime_ns,
+                    [[name, is_file, is_dir] for name, _, is_file, is_dir in contents]
+                ]
+                self._dirty = True
+        return contents
+
+    def save(self):
+        """Write the index back to `index_path` if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._index_path.with_name(f"{self._index_path.name}.tmp-{os.getpid()}")
+            with tmp_path.open("w") as f:
+                json.dump(self._listings, f, separators=(',', ':'))
+            os.replace(tmp_path, self._index_path)
+            self._dirty = False
@@ -0,0 +1,377 @@
+# A flat, array-backed store for very large directory trees
+#
+# Author: Indrajit Ghosh
+# Created On: Oct 18, 2026
+#
+
+import os
+from array import array
+from pathlib import Path
+from .model import File, Directory, _copy_file, _same_file
+from .snapshot import KIND_DIR, KIND_FILE, FLAG_TEXT
+
+__all__ = [
+    "TreeStore",
+    "DirectoryView",
+    "FileView"
+]
+
+BLOB_EMPTY = -1   # An empty file.
+BLOB_SOURCE = -2  # A lazy file, read from its source path when needed.
+
+
+class TreeStore:
+    """
+    A directory tree kept in parallel arrays instead of a graph of
+    `Directory` and `File` objects: one slot per node in each of `parent`,
+    `name_offset`/`name_len` (into one shared utf-8 string table), `kind`,
+    `flags`, `size`, `blob` (into the list of distinct contents) and
+    `subtree_end`.
+
+    Nodes are stored in pre-order with node 0 the root, so a node's subtree
+    is the index range `[node, subtree_end[node])`, and creating or printing
+    the tree is a plain loop rather than a recursion. A node costs about
+    30 bytes plus its name, against a few hundred for the object graph.
+
+    USAGE:
+        >>> store = TreeStore.from_path("my_monorepo")
+        >>> store.nbytes / len(store)
+        44.6
+        >>> store.root.create("/tmp/copy")
+        >>> print(store.root)
+    """
+    def __init__(self):
+        self._parent = array('i')
+        self._name_offset = array('I')
+        self._name_len = array('I')
+        self._kind = array('B')
+        self._flags = array('B')
+        self._size = array('Q')
+        self._blob = array('i')
+        self._subtree_end = array('I')
+        self._names = bytearray()
+        self._blobs = []
+        # Source paths of the lazy nodes of a store built `from_path`:
+        # the root's path here, the rest is made from the node names.
+        self._source_root = None
+        # ... and of a store built `from_directory`: node index -> path.
+        self._sources = {}
+
+    def __len__(self):
+        return len(self._kind)
+
+    @property
+    def root(self):
+        return DirectoryView(self, 0)
+
+    @property
+    def nbytes(self):
+        """Memory held by the node arrays, the names and the contents."""
+        arrays = (
+            self._parent, self._name_offset, self._name_len, self._kind,
+            self._flags, self._size, self._blob, self._subtree_end
+        )
+        return (
+            sum(a.itemsize * len(a) for a in arrays)
+            + len(self._names)
+            + sum(len(blob) for blob in self._blobs)
+        )
+
+    # Building
+
+    def _add(self, parent:int, name:str, kind:int, names:dict, size:int=0, blob:int=BLOB_EMPTY, flags:int=0):
+        """Append a node and return its index; `subtree_end` is set by the caller."""
+        encoded = name.encode('utf-8', 'surrogateescape')
+        offset = names.get(encoded)
+        if offset is None:
+            offset = names[encoded] = len(self._names)
+            self._names += encoded
+        index = len(self._kind)
+        self._parent.append(parent)
+        self._name_offset.append(offset)
+        self._name_len.append(len(encoded))
+        self._kind.append(kind)
+        self._flags.append(flags)
+        self._size.append(size)
+        self._blob.append(blob)
+        self._subtree_end.append(index + 1)
+        return index
+
+    def _add_blob(self, data:bytes, blobs:dict):
+        """Index of `data` in `_blobs`; identical contents are stored once."""
+        if not data:
+            return BLOB_EMPTY
+        index = blobs.get(data)
+        if index is None:
+            index = blobs[data] = len(self._blobs)
+            self._blobs.append(data)
+        return index
+
+    @classmethod
+    def from_path(cls, dir_path:Path, lazy:bool=True):
+        """
+        Snapshot the directory `dir_path`, skipping `Directory.IGNORE`, in
+        the order `os.scandir` lists it (as `instantiate_dir_from_path` does).
+
+        :param `lazy`: Only record the files' sizes, and read them from
+                       disk when they are needed. Otherwise the contents are
+                       read now, each distinct content stored once.
+        """
+        store = cls()
+        store._source_root = os.fspath(dir_path)
+        names, blobs = {}, {}
+
+        # Items are (path, parent, name, is_dir), or (None, index) to close
+        # the subtree of `index` once everything below it has been added.
+        stack = [(store._source_root, -1, Path(dir_path).name or "untitled_directory", True)]
+        while stack:
+            item = stack.pop()
+            if item[0] is None:
+                store._subtree_end[item[1]] = len(store)
+                continue
+
+            path, parent, name, is_dir = item
+            if not is_dir:
+                if lazy:
+                    size, blob = os.stat(path).st_size, BLOB_SOURCE
+                else:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                    size, blob = len(data), store._add_blob(data, blobs)
+                store._add(parent, name, KIND_FILE, names, size=size, blob=blob)
+                continue
+
+            index = store._add(parent, name, KIND_DIR, names)
+            stack.append((None, index))
+            with os.scandir(path) as entries:
+                children = [
+                    (entry.path, index, entry.name, entry.is_dir())
+                    for entry in entries
+                    if entry.name not in Directory.IGNORE and (entry.is_file() or entry.is_dir())
+                ]
+            stack.extend(reversed(children))
+
+        return store
+
+    @classmethod
+    def from_directory(cls, directory:Directory):
+        """Convert a `Directory` object tree; lazy files stay lazy."""
+        store = cls()
+        names, blobs = {}, {}
+
+        stack = [(directory, -1, directory.name)]
+        while stack:
+            entry, parent, name = stack.pop()
+            if entry is None:
+                store._subtree_end[parent] = len(store)
+            elif isinstance(entry, Directory):
+                index = store._add(parent, name, KIND_DIR, names)
+                stack.append((None, index, None))
+                stack.extend(
+                    (child, index, child_name)
+                    for child_name, child in reversed(list(entry.content.items()))
+                )
+            elif entry.is_lazy:
+                index = store._add(parent, name, KIND_FILE, names, size=entry.size, blob=BLOB_SOURCE)
+                store._sources[index] = os.fspath(entry.source_path)
+            else:
+                binary_content = entry.binary_content
+                if binary_content:
+                    data, flags = bytes(binary_content), 0
+                else:
+                    data, flags = (entry.content or "").encode(), FLAG_TEXT
+                store._add(
+                    parent, name, KIND_FILE, names,
+                    size=len(data), blob=store._add_blob(data, blobs), flags=flags
+                )
+
+        return store
+
+    # Reading
+
+    def name(self, index:int):
+        offset = self._name_offset[index]
+        return self._names[offset:offset + self._name_len[index]].decode('utf-8', 'surrogateescape')
+
+    def is_dir(self, index:int):
+        return self._kind[index] == KIND_DIR
+
+    def children(self, index:int):
+        """Indices of the nodes directly below `index`, in order."""
+        child, end = index + 1, self._subtree_end[index]
+        while child < end:
+            yield child
+            child = self._subtree_end[child]
+
+    def relative_path(self, index:int):
+        """Path of `index` relative to the root's parent, e.g. `root/a/b.txt`."""
+        parts = []
+        while index != -1:
+            parts.append(self.name(index))
+            index = self._parent[index]
+        return os.path.join(*reversed(parts))
+
+    def source_path(self, index:int):
+        """Path a lazy file is read from, or None if its content is stored."""
+        if self._blob[index] != BLOB_SOURCE:
+            return None
+        if index in self._sources:
+            return self._sources[index]
+        parts = []
+        while index > 0:
+            parts.append(self.name(index))
+            index = self._parent[index]
+        return os.path.join(self._source_root, *reversed(parts))
+
+    def data(self, index:int):
+        """The bytes `create` writes for the file `index`."""
+        blob = self._blob[index]
+        if blob >= 0:
+            return self._blobs[blob]
+        if blob == BLOB_SOURCE:
+            with open(self.source_path(index), "rb") as f:
+                return f.read()
+        return b""
+
+    # Writing and printing
+
+    def create(self, path, index:int=0, exist_ok:bool=False):
+        """
+        Create the node `index` (by default the whole tree) with everything
+        below it in the directory `path`, in one pass over its subtree.
+        """
+        dir_paths = {}
+        for node in range(index, self._subtree_end[index]):
+            parent_path = dir_paths[self._parent[node]] if node != index else os.fspath(path)
+            node_path = os.path.join(parent_path, self.name(node))
+
+            if self._kind[node] == KIND_DIR:
+                if node == index:
+                    os.makedirs(node_path, exist_ok=exist_ok)
+                else:
+                    os.mkdir(node_path)
+                dir_paths[node] = node_path
+            elif self._blob[node] == BLOB_SOURCE:
+                # As in `File.create`: never copy a source over itself.
+                if not _same_file(self.source_path(node), node_path):
+                    _copy_file(self.source_path(node), node_path, File.CHUNK_SIZE)
+            else:
+                with open(node_path, "wb") as f:
+                    f.write(self.data(node))
+
+    def tree_lines(self, index:int=0, prefix:str=''):
+        """
+        The lines of `Directory.tree` for the directory `index`. Pre-order
+        is the order the lines are printed in, so this is a single loop over
+        the subtree: an entry is its parent's last one iff their subtrees
+        end together.
+        """
+        space, branch, tee, last = '    ', '│   ', '├── ', '└── '
+        parents, kinds, ends = self._parent, self._kind, self._subtree_end
+
+        prefixes = {index: prefix}  # directory -> prefix of its entries
+        skip_until = 0              # end of an ignored subtree being skipped
+        for node in range(index + 1, ends[index]):
+            if node < skip_until:
+                continue
+            name = self.name(node)
+            if name in Directory.IGNORE:
+                skip_until = ends[node]
+                continue
+            parent = parents[node]
+            pointer = last if ends[node] == ends[parent] else tee
+            is_dir = kinds[node] == KIND_DIR
+            yield prefixes[parent] + pointer + Directory._colored_entry(name, "Directory" if is_dir else "File")
+            if is_dir:
+                prefixes[node] = prefixes[parent] + (branch if pointer == tee else space)
+
+
+class DirectoryView:
+    """
+    A `Directory`-like view of a directory node of a `TreeStore`; nothing
+    is copied out of the store until it is asked for.
+    """
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store:TreeStore, index:int):
+        self._store = store
+        self._index = index
+
+    @property
+    def name(self):
+        return self._store.name(self._index)
+
+    @property
+    def content(self):
+        """A fresh dict of the entries' views, by name."""
+        store = self._store
+        return {
+            store.name(child): (DirectoryView if store.is_dir(child) else FileView)(store, child)
+            for child in store.children(self._index)
+        }
+
+    def create(self, path, exist_ok:bool=False):
+        self._store.create(path, self._index, exist_ok=exist_ok)
+
+    def _tree(self, prefix:str=''):
+        return self._store.tree_lines(self._index, prefix)
+
+    @property
+    def tree(self):
+        return "\n".join(self._tree())
+
+    def __str__(self):
+        return Directory.__str__(self)
+
+    def to_directory(self):
+        """Copy the subtree out of the store into `Directory` and `File` objects."""
+        directory = Directory(name=self.name)
+        for name, entry in self.content.items():
+            directory.content[name] = entry.to_directory() if isinstance(entry, DirectoryView) else entry.to_file()
+        return directory
+
+
+class FileView:
+    """A `File`-like view of a file node of a `TreeStore`."""
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store:TreeStore, index:int):
+        self._store = store
+        self._index = index
+
+    @property
+    def name(self):
+        return self._store.name(self._index)
+
+    @property
+    def content(self):
+        if self._store._flags[self._index] & FLAG_TEXT:
+            return self._store.data(self._index).decode()
+        return None
+
+    @property
+    def binary_content(self):
+        if self._store._flags[self._index] & FLAG_TEXT:
+            return None
+        return self._store.data(self._index) or None
+
+    @property
+    def size(self):
+        return self._store._size[self._index]
+
+    @property
+    def is_lazy(self):
+        return self._store._blob[self._index] == BLOB_SOURCE
+
+    @property
+    def source_path(self):
+        source = self._store.source_path(self._index)
+        return None if source is None else Path(source)
+
+    def create(self, path):
+        self._store.create(path, self._index)
+
+    def to_file(self):
+        if self.is_lazy:
+            return File(name=self.name, source_path=self.source_path)
+        return File(content=self.content, binary_content=self.binary_content, name=self.name)